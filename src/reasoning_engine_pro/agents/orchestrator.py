@@ -78,13 +78,11 @@ class ConversationOrchestrator:
             status=ConversationStatus.ACTIVE,
             user_info=user_info,
         )
-        await self._storage.save_state(conversation_id, state)
-
         user_message = ChatMessage(
             role=MessageRole.USER,
             content=initial_message,
         )
-        await self._storage.save_message(conversation_id, user_message)
+        await self._storage.save_initial(conversation_id, state, user_message)
 
         if self._event_emitter:
             await self._event_emitter.emit(
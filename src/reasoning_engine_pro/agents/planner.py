@@ -54,7 +54,7 @@ class PlannerAgent:
 
     def _get_tool_definitions(self) -> list[ToolDefinition]:
         """Get tool definitions for LLM."""
-        return TOOL_DEFINITIONS
+        return list(TOOL_DEFINITIONS)
 
     async def plan(
         self,
@@ -104,8 +104,10 @@ class PlannerAgent:
                     conversation_id=conversation_id,
                     message_count=len(full_messages),
                 )
-                # Keep system message, summarize the rest
-                summarized = await self._summarizer.summarize(full_messages)
+                # Keep system message and recent turns, summarize the rest
+                summarized = await self._summarizer.summarize(
+                    full_messages, keep_recent_tokens=self._token_limit // 2
+                )
                 full_messages = summarized
 
             tool_calls: list[ToolCall] = []
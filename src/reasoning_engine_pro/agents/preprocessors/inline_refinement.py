@@ -1,5 +1,7 @@
 """Inline query refinement — augments the planner prompt instead of making a separate LLM call."""
 
+from functools import cached_property
+
 from ...core.interfaces.query_preprocessor import IQueryPreprocessor
 from ...core.schemas.messages import ChatMessage, UserInfo
 from ..prompts.domain_data import (
@@ -30,14 +32,18 @@ class InlineRefinementPreprocessor(IQueryPreprocessor):
         "6. Use think_approach to outline your plan before building.\n"
     )
 
+    @cached_property
+    def _guidance(self) -> str:
+        """Guidance text; the domain data is static, so format it once."""
+        return self._GUIDANCE.format(
+            config_sequences=format_config_sequences(),
+            pillar_module_data=format_pillar_module_data(),
+        )
+
     async def preprocess(
         self,
         message: str,
         history: list[ChatMessage],
         user_info: UserInfo | None = None,
     ) -> str:
-        guidance = self._GUIDANCE.format(
-            config_sequences=format_config_sequences(),
-            pillar_module_data=format_pillar_module_data(),
-        )
-        return message + guidance
+        return message + self._guidance
@@ -2,8 +2,11 @@
 
 Pure data module — no logic. Contains ERP pillar/module mappings,
 configuration sequences, business process maps, and block type descriptions.
+The format_* helpers are cached; the data above is treated as read-only.
 """
 
+from functools import lru_cache
+
 PILLAR_MODULE_MAP: dict[str, list[str]] = {
     "HCM": [
         "Core HR",
@@ -96,6 +99,7 @@ BLOCK_TYPE_DESCRIPTIONS: dict[str, str] = {
 }
 
 
+@lru_cache
 def format_pillar_module_data() -> str:
     """Format pillar/module map as a readable string for prompt injection."""
     lines = []
@@ -104,6 +108,7 @@ def format_pillar_module_data() -> str:
     return "\n".join(lines)
 
 
+@lru_cache
 def format_config_sequences() -> str:
     """Format ERP configuration sequences for prompt injection."""
     lines = []
@@ -112,6 +117,7 @@ def format_config_sequences() -> str:
     return "\n".join(lines)
 
 
+@lru_cache
 def format_block_type_descriptions() -> str:
     """Format block type descriptions for prompt injection."""
     lines = []
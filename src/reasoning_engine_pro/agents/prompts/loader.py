@@ -29,13 +29,22 @@ class PromptLoader:
         if templates_dir is None:
             templates_dir = Path(__file__).parent / "templates"
         self._templates_dir = templates_dir
+        self._templates: dict[str, str] = {}
 
     def load(self, name: str) -> str:
-        """Load a prompt template by name (tries .md then .txt)."""
+        """Load a prompt template by name (tries .md then .txt).
+
+        Templates ship with the package, so each is read from disk once
+        per loader and served from memory afterwards.
+        """
+        template = self._templates.get(name)
+        if template is not None:
+            return template
         for ext in self._EXTENSIONS:
             template_path = self._templates_dir / f"{name}{ext}"
             if template_path.exists():
-                return template_path.read_text()
+                template = self._templates[name] = template_path.read_text()
+                return template
         raise FileNotFoundError(
             f"Prompt template not found: {self._templates_dir / name}"
         )
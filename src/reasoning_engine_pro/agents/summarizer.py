@@ -3,6 +3,7 @@
 from ..core.enums import MessageRole
 from ..core.interfaces.llm_provider import ILLMProvider
 from ..core.schemas.messages import ChatMessage
+from ..core.utils.token_estimation import estimate_tokens
 from ..observability.logger import get_logger
 from .prompts.loader import PromptLoader
 
@@ -21,61 +22,102 @@ class MessageSummarizer:
     def __init__(self, llm_provider: ILLMProvider):
         self._llm = llm_provider
 
-    async def summarize(self, messages: list[ChatMessage]) -> list[ChatMessage]:
+    @staticmethod
+    def _tail_start(messages: list[ChatMessage], keep_recent_tokens: int) -> int:
+        """Index of the first message of the verbatim tail within the budget."""
+        start = len(messages)
+        used = 0
+        while start > 0 and messages[start - 1].role != MessageRole.SYSTEM:
+            used += estimate_tokens([messages[start - 1]])
+            if used > keep_recent_tokens:
+                break
+            start -= 1
+
+        # A tool result cannot lead the tail without the assistant message
+        # that issued the call, so fold leading tool results into the summary.
+        while start < len(messages) and messages[start].role == MessageRole.TOOL:
+            start += 1
+        return start
+
+    async def summarize(
+        self,
+        messages: list[ChatMessage],
+        keep_recent_tokens: int = 0,
+    ) -> list[ChatMessage]:
         """Summarize a list of messages into a condensed form.
 
-        Returns a list containing the system message (if present) plus
-        a single summary message.
+        Args:
+            messages: Conversation to condense.
+            keep_recent_tokens: Estimated-token budget for the most recent
+                messages, which are kept verbatim after the summary.
+
+        Returns a list containing the system message (if present), a single
+        summary message, and the preserved recent messages. When there is
+        nothing to condense, or the LLM call fails, ``messages`` itself is
+        returned rather than a copy, so mutating the result mutates the
+        caller's list.
         """
         if len(messages) <= 2:
             return messages
 
+        split = self._tail_start(messages, keep_recent_tokens)
+        tail = messages[split:]
+        if all(msg.role == MessageRole.SYSTEM for msg in messages[:split]):
+            return messages  # Everything fits in the tail; nothing to condense
+
+        head = messages[:split]
+        system_msg: ChatMessage | None = None
+        for msg in head:
+            if msg.role == MessageRole.SYSTEM:
+                system_msg = msg
+
+        try:
+            summary_text = await self._llm_summary(head)
+        except Exception as e:
+            logger.warning("Summarization failed, keeping original messages", error=str(e))
+            return messages
+
+        result: list[ChatMessage] = []
+        if system_msg:
+            result.append(system_msg)
+        result.append(
+            ChatMessage(
+                role=MessageRole.USER,
+                content=f"[Conversation Summary]\n{summary_text}",
+            )
+        )
+        result.extend(tail)
+
+        logger.info(
+            "Conversation summarized",
+            original_count=len(messages),
+            preserved_count=len(tail),
+            summary_length=len(summary_text),
+        )
+        return result
+
+    async def _llm_summary(self, messages: list[ChatMessage]) -> str:
+        """Ask the LLM to condense the non-system messages into summary text."""
         system_prompt = _loader.load("summarizer_system")
 
         # Build conversation text for summarization
         conversation_parts: list[str] = []
-        system_msg: ChatMessage | None = None
-
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
-                system_msg = msg
                 continue
             role_label = msg.role.value.capitalize()
             conversation_parts.append(f"{role_label}: {msg.content or ''}")
 
         conversation_text = "\n\n".join(conversation_parts)
 
-        try:
-            summary_response = await self._llm.generate(
-                messages=[
-                    ChatMessage(role=MessageRole.SYSTEM, content=system_prompt),
-                    ChatMessage(
-                        role=MessageRole.USER,
-                        content=f"Summarize this conversation:\n\n{conversation_text}",
-                    ),
-                ],
-                temperature=0.1,
-            )
-
-            summary_text = summary_response.content or conversation_text
-
-            result: list[ChatMessage] = []
-            if system_msg:
-                result.append(system_msg)
-            result.append(
+        summary_response = await self._llm.generate(
+            messages=[
+                ChatMessage(role=MessageRole.SYSTEM, content=system_prompt),
                 ChatMessage(
                     role=MessageRole.USER,
-                    content=f"[Conversation Summary]\n{summary_text}",
-                )
-            )
-
-            logger.info(
-                "Conversation summarized",
-                original_count=len(messages),
-                summary_length=len(summary_text),
-            )
-            return result
-
-        except Exception as e:
-            logger.warning("Summarization failed, keeping original messages", error=str(e))
-            return messages
+                    content=f"Summarize this conversation:\n\n{conversation_text}",
+                ),
+            ],
+            temperature=0.1,
+        )
+        return summary_response.content or conversation_text
@@ -1,11 +1,17 @@
 """Workflow structural validator."""
 
 import re
+from collections import deque
 
 from ..core.interfaces.event_emitter import IEventEmitter
 from ..core.interfaces.validator import IWorkflowValidator, ValidationContext, ValidationResult
 from ..core.schemas.workflow import Block, Workflow
 
+# Checked once per block/edge on every validation; compiled once at import.
+_BLOCK_ID_RE = re.compile(r"^B\d{3}$")
+_EDGE_ID_RE = re.compile(r"^E\d{3}$")
+_EDGE_CONDITIONS = frozenset({"true", "false"})
+
 
 class StructuralValidator(IWorkflowValidator):
     """Validates workflow structure and block references.
@@ -86,11 +92,11 @@ class StructuralValidator(IWorkflowValidator):
         current_step += 1
 
         await emit_progress("blocks", "Validating blocks...")
-        self._validate_blocks(workflow, result)
+        block_ids = self._validate_blocks(workflow, result)
         current_step += 1
 
         await emit_progress("edges", "Validating edges...")
-        self._validate_edges(workflow, result)
+        self._validate_edges(workflow, result, block_ids)
         current_step += 1
 
         await emit_progress("references", "Validating output references...")
@@ -98,7 +104,7 @@ class StructuralValidator(IWorkflowValidator):
         current_step += 1
 
         await emit_progress("flow", "Validating execution flow...")
-        self._validate_flow(workflow, result)
+        self._validate_flow(workflow, result, block_ids)
         current_step += 1
 
         if self._strict_mode and result.warnings:
@@ -116,9 +122,14 @@ class StructuralValidator(IWorkflowValidator):
         if not workflow.edges and len(workflow.workflow_json) > 1:
             result.add_warning("Workflow has multiple blocks but no edges")
 
-    def _validate_blocks(self, workflow: Workflow, result: ValidationResult) -> None:
-        """Validate individual blocks."""
-        block_ids = set()
+    def _validate_blocks(
+        self, workflow: Workflow, result: ValidationResult
+    ) -> set[str]:
+        """Validate individual blocks.
+
+        Returns the set of BlockIds, which the edge and flow checks reuse.
+        """
+        block_ids: set[str] = set()
         has_start = False
 
         for block in workflow.workflow_json:
@@ -126,7 +137,7 @@ class StructuralValidator(IWorkflowValidator):
                 result.add_error(f"Duplicate BlockId: {block.BlockId}")
             block_ids.add(block.BlockId)
 
-            if not re.match(r"^B\d{3}$", block.BlockId):
+            if not _BLOCK_ID_RE.match(block.BlockId):
                 result.add_warning(
                     f"BlockId '{block.BlockId}' doesn't follow B### pattern"
                 )
@@ -147,6 +158,8 @@ class StructuralValidator(IWorkflowValidator):
         if not has_start:
             result.add_error("Workflow must have a Start block")
 
+        return block_ids
+
     def _validate_block_io(self, block: Block, result: ValidationResult) -> None:
         """Validate block inputs and outputs against known action requirements."""
         if block.ActionCode not in self.KNOWN_ACTIONS:
@@ -162,17 +175,18 @@ class StructuralValidator(IWorkflowValidator):
                     f"missing recommended input: {required}"
                 )
 
-    def _validate_edges(self, workflow: Workflow, result: ValidationResult) -> None:
+    def _validate_edges(
+        self, workflow: Workflow, result: ValidationResult, block_ids: set[str]
+    ) -> None:
         """Validate edges."""
         edge_ids = set()
-        block_ids = {block.BlockId for block in workflow.workflow_json}
 
         for edge in workflow.edges:
             if edge.EdgeID in edge_ids:
                 result.add_error(f"Duplicate EdgeID: {edge.EdgeID}")
             edge_ids.add(edge.EdgeID)
 
-            if not re.match(r"^E\d{3}$", edge.EdgeID):
+            if not _EDGE_ID_RE.match(edge.EdgeID):
                 result.add_warning(
                     f"EdgeID '{edge.EdgeID}' doesn't follow E### pattern"
                 )
@@ -190,7 +204,7 @@ class StructuralValidator(IWorkflowValidator):
             if edge.From == edge.To:
                 result.add_warning(f"Edge {edge.EdgeID} is a self-loop")
 
-            if edge.EdgeCondition and edge.EdgeCondition not in ["true", "false"]:
+            if edge.EdgeCondition and edge.EdgeCondition not in _EDGE_CONDITIONS:
                 result.add_warning(
                     f"Edge {edge.EdgeID} has unusual condition: {edge.EdgeCondition}"
                 )
@@ -213,13 +227,13 @@ class StructuralValidator(IWorkflowValidator):
                             f"{inp.ReferencedOutputVariableName}"
                         )
 
-    def _validate_flow(self, workflow: Workflow, result: ValidationResult) -> None:
+    def _validate_flow(
+        self, workflow: Workflow, result: ValidationResult, block_ids: set[str]
+    ) -> None:
         """Validate execution flow."""
         if not workflow.workflow_json:
             return
 
-        block_ids = {block.BlockId for block in workflow.workflow_json}
-
         outgoing: dict[str, list[str]] = {bid: [] for bid in block_ids}
         incoming: dict[str, list[str]] = {bid: [] for bid in block_ids}
 
@@ -237,10 +251,10 @@ class StructuralValidator(IWorkflowValidator):
             result.add_error("Start block should not have incoming edges")
 
         reachable = {start_block.BlockId}
-        queue = [start_block.BlockId]
+        queue = deque([start_block.BlockId])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             for next_block in outgoing.get(current, []):
                 if next_block not in reachable:
                     reachable.add(next_block)
@@ -260,10 +274,10 @@ class StructuralValidator(IWorkflowValidator):
         result = ValidationResult()
 
         self._validate_structure(workflow, result)
-        self._validate_blocks(workflow, result)
-        self._validate_edges(workflow, result)
+        block_ids = self._validate_blocks(workflow, result)
+        self._validate_edges(workflow, result, block_ids)
         self._validate_references(workflow, result)
-        self._validate_flow(workflow, result)
+        self._validate_flow(workflow, result, block_ids)
 
         return result
 
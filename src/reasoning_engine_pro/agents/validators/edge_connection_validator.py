@@ -34,32 +34,23 @@ class EdgeConnectionValidator(IWorkflowValidator):
     ) -> ValidationResult:
         result = ValidationResult()
 
+        # Edges stay as the workflow's own (already validated) Edge models;
+        # round-tripping them through dicts re-validated every one.
         blocks = list(workflow.workflow_json)
-        edges = [e.model_dump() for e in workflow.edges]
+        edges = list(workflow.edges)
 
         # Step 1: Ensure Start block exists
         blocks, edges = self._ensure_start_block(blocks, edges, result)
 
-        # Step 2: Deduplicate edges
-        edges = self._deduplicate_edges(edges, result)
+        # Step 2: Deduplicate edges and remove self-loops in one pass
+        edges = self._clean_edges(edges, result)
 
-        # Step 3: Remove self-loops
-        edges = self._remove_self_loops(edges, result)
-
-        # Step 4: Check for disconnected blocks
+        # Step 3: Check for disconnected blocks
         self._check_disconnected(blocks, edges, result)
 
-        # Build corrected Edge models
-        edge_models = []
-        for e in edges:
-            try:
-                edge_models.append(Edge.model_validate(e))
-            except Exception:
-                pass
-
         result.corrected_workflow = Workflow(
             workflow_json=blocks,
-            edges=edge_models,
+            edges=edges,
             job_name=workflow.job_name,
         )
 
@@ -68,9 +59,9 @@ class EdgeConnectionValidator(IWorkflowValidator):
     def _ensure_start_block(
         self,
         blocks: list[Block],
-        edges: list[dict],
+        edges: list[Edge],
         result: ValidationResult,
-    ) -> tuple[list[Block], list[dict]]:
+    ) -> tuple[list[Block], list[Edge]]:
         """Add a Start block if missing and connect it to entry-point blocks."""
         has_start = any(b.ActionCode == "Start" for b in blocks)
         if has_start:
@@ -91,7 +82,7 @@ class EdgeConnectionValidator(IWorkflowValidator):
         blocks = [start_block] + blocks
 
         # Find blocks with no incoming edges
-        targets_with_incoming = {e.get("To") for e in edges}
+        targets_with_incoming = {e.To for e in edges}
         entry_blocks = [
             b.BlockId for b in blocks
             if b.BlockId != start_id and b.BlockId not in targets_with_incoming
@@ -100,54 +91,39 @@ class EdgeConnectionValidator(IWorkflowValidator):
         max_edge_num = self._max_edge_num(edges)
         for bid in entry_blocks:
             max_edge_num += 1
-            edges.append({
-                "EdgeID": f"E{max_edge_num:03d}",
-                "From": start_id,
-                "To": bid,
-            })
+            edges.append(Edge(EdgeID=f"E{max_edge_num:03d}", From=start_id, To=bid))
 
         return blocks, edges
 
-    def _deduplicate_edges(
-        self, edges: list[dict], result: ValidationResult
-    ) -> list[dict]:
-        """Remove duplicate edges (same From+To pair)."""
+    def _clean_edges(
+        self, edges: list[Edge], result: ValidationResult
+    ) -> list[Edge]:
+        """Remove duplicate edges (same From+To pair) and self-loops (From == To)."""
         seen: set[tuple[str, str]] = set()
-        unique: list[dict] = []
+        clean: list[Edge] = []
         for e in edges:
-            pair = (e.get("From", ""), e.get("To", ""))
+            pair = (e.From, e.To)
             if pair in seen:
-                result.add_warning(
-                    f"Duplicate edge removed: {e.get('From')} -> {e.get('To')}"
-                )
+                result.add_warning(f"Duplicate edge removed: {e.From} -> {e.To}")
                 continue
             seen.add(pair)
-            unique.append(e)
-        return unique
-
-    def _remove_self_loops(
-        self, edges: list[dict], result: ValidationResult
-    ) -> list[dict]:
-        """Remove edges where From == To."""
-        clean: list[dict] = []
-        for e in edges:
-            if e.get("From") == e.get("To"):
-                result.add_warning(f"Self-loop removed: {e.get('EdgeID', '?')}")
-            else:
-                clean.append(e)
+            if e.From == e.To:
+                result.add_warning(f"Self-loop removed: {e.EdgeID}")
+                continue
+            clean.append(e)
         return clean
 
     def _check_disconnected(
         self,
         blocks: list[Block],
-        edges: list[dict],
+        edges: list[Edge],
         result: ValidationResult,
     ) -> None:
         """Warn about blocks with no connections at all."""
         connected = set()
         for e in edges:
-            connected.add(e.get("From"))
-            connected.add(e.get("To"))
+            connected.add(e.From)
+            connected.add(e.To)
 
         for b in blocks:
             if b.ActionCode == "Start":
@@ -158,11 +134,11 @@ class EdgeConnectionValidator(IWorkflowValidator):
                 )
 
     @staticmethod
-    def _max_edge_num(edges: list[dict]) -> int:
+    def _max_edge_num(edges: list[Edge]) -> int:
         """Get the highest edge number from existing edge IDs."""
         max_num = 0
         for e in edges:
-            eid = e.get("EdgeID", "")
+            eid = e.EdgeID
             if eid.startswith("E") and eid[1:].isdigit():
                 max_num = max(max_num, int(eid[1:]))
         return max_num
@@ -1,8 +1,10 @@
 """LLM-based per-block validator with parallel execution."""
 
 import asyncio
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -29,6 +31,13 @@ logger = get_logger(__name__)
 
 _CUSTOM_ACTION_CODES = {"HumanDependent", "AskWilfred", "HumanDependable"}
 
+# Response patterns are compiled once at import; every validated block is parsed.
+_ADD_EDGES_RE = re.compile(r"Add:\s*(\[.*?\])", re.DOTALL)
+_REMOVE_EDGES_RE = re.compile(r"Remove:\s*(\[.*?\])", re.DOTALL)
+# No \s* around the lazy body: that forces a whitespace probe at every character.
+# json.loads ignores the surrounding whitespace the group now keeps.
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+
 
 @dataclass
 class _BlockValidationResult:
@@ -55,10 +64,15 @@ class LLMBlockValidator(IWorkflowValidator):
         llm_provider: ILLMProvider,
         search_service: TaskBlockSearchService,
         max_parallel: int = 5,
+        cache_size: int = 128,
     ):
         self._llm = llm_provider
         self._search = search_service
         self._max_parallel = max_parallel
+        # LRU of validator LLM responses, keyed by a digest of the full prompt
+        # (block, search results, workflow, edges and user query).
+        self._cache_size = cache_size
+        self._responses: OrderedDict[bytes, str] = OrderedDict()
 
     @property
     def name(self) -> str:
@@ -91,8 +105,10 @@ class LLMBlockValidator(IWorkflowValidator):
                     index, blocks[index], block_dicts, edge_dicts, context
                 )
 
-        # Run all blocks in parallel
-        tasks = [_validate_one(i) for i in range(len(blocks))]
+        # Run all non-Start blocks in parallel; Start blocks pass through as-is
+        # and shouldn't hold a semaphore slot.
+        indices = [i for i, b in enumerate(blocks) if b.ActionCode != "Start"]
+        tasks = [_validate_one(i) for i in indices]
         block_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Aggregate results
@@ -100,10 +116,11 @@ class LLMBlockValidator(IWorkflowValidator):
         all_edges_to_add: list[dict] = []
         all_edges_to_remove: list[dict] = []
 
-        for br in block_results:
+        for index, br in zip(indices, block_results):
             if isinstance(br, Exception):
-                logger.error("Block validation error", error=str(br))
-                result.add_warning(f"Block validation failed: {br}")
+                block_id = blocks[index].BlockId
+                logger.error("Block validation error", block_id=block_id, error=str(br))
+                result.add_warning(f"Block validation failed for {block_id}: {br}")
                 continue
             corrected_blocks[br.index] = br.block
             all_edges_to_add.extend(br.edges_to_add)
@@ -138,13 +155,7 @@ class LLMBlockValidator(IWorkflowValidator):
         edge_dicts: list[dict],
         context: ValidationContext,
     ) -> _BlockValidationResult:
-        """Validate a single block against the task block library."""
-        # Skip Start blocks
-        if block.ActionCode == "Start":
-            return _BlockValidationResult(
-                index=index, block=block, edges_to_add=[], edges_to_remove=[]
-            )
-
+        """Validate a single non-Start block against the task block library."""
         block_dict = block.model_dump()
 
         # 1. Search for matching task blocks
@@ -225,8 +236,22 @@ class LLMBlockValidator(IWorkflowValidator):
             logger.warning("Task block search failed", block_id=block.BlockId, error=str(e))
             return []
 
+    def clear_cache(self) -> None:
+        """Drop all cached validator LLM responses."""
+        self._responses.clear()
+
     async def _call_llm(self, prompt: str) -> str:
-        """Call the validator LLM with a prompt. Non-streaming."""
+        """Call the validator LLM with a prompt. Non-streaming.
+
+        Responses are cached per prompt, so re-validating an unchanged block
+        in an unchanged workflow skips the LLM round-trip.
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        cached = self._responses.get(key)
+        if cached is not None:
+            self._responses.move_to_end(key)
+            return cached
+
         messages = [
             ChatMessage(role=MessageRole.USER, content=prompt),
         ]
@@ -234,7 +259,13 @@ class LLMBlockValidator(IWorkflowValidator):
             messages=messages,
             temperature=0.3,
         )
-        return response.content or ""
+        content = response.content or ""
+
+        if content and self._cache_size > 0:
+            self._responses[key] = content
+            if len(self._responses) > self._cache_size:
+                self._responses.popitem(last=False)
+        return content
 
     def _parse_validation_response(
         self, response: str, original_block: dict
@@ -255,14 +286,14 @@ class LLMBlockValidator(IWorkflowValidator):
         }
 
         # Always extract edge modifications (they can exist even with NO_CHANGES_NEEDED)
-        add_match = re.search(r"Add:\s*(\[.*?\])", response, re.DOTALL)
+        add_match = _ADD_EDGES_RE.search(response)
         if add_match:
             try:
                 result["edges_to_add"] = json.loads(add_match.group(1).strip())
             except json.JSONDecodeError:
                 pass
 
-        remove_match = re.search(r"Remove:\s*(\[.*?\])", response, re.DOTALL)
+        remove_match = _REMOVE_EDGES_RE.search(response)
         if remove_match:
             try:
                 result["edges_to_remove"] = json.loads(remove_match.group(1).strip())
@@ -277,7 +308,7 @@ class LLMBlockValidator(IWorkflowValidator):
             return result
 
         # Extract corrected block JSON from code fences
-        json_matches = re.findall(r"```json\s*([\s\S]*?)\s*```", response)
+        json_matches = _JSON_FENCE_RE.findall(response)
         if json_matches:
             try:
                 corrected = json.loads(json_matches[-1])
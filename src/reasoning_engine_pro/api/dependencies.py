@@ -48,6 +48,11 @@ class Dependencies:
         """Reset singleton (for testing)."""
         cls._instance = None
 
+    def reset_state(self) -> None:
+        """Clear in-memory conversation data, keeping wired providers (for testing)."""
+        if isinstance(self._storage, InMemoryStorage):
+            self._storage.clear()
+
     async def get_storage(self) -> IConversationStorage:
         """Get storage instance."""
         if self._storage is None:
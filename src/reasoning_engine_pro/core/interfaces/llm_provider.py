@@ -15,17 +15,26 @@ class ToolDefinition:
     name: str
     description: str
     parameters: dict[str, Any]
+    _openai_format: Optional[dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """Convert to OpenAI function calling format.
+
+        Definitions are static, so the payload is built once and the same
+        dict is returned on every LLM call.
+        """
+        if self._openai_format is None:
+            self._openai_format = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return self._openai_format
 
 
 @dataclass
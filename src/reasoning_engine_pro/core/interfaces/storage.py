@@ -32,7 +32,8 @@ class IConversationStorage(ABC):
 
         Args:
             conversation_id: Unique conversation identifier
-            max_messages: Optional limit on messages to retrieve
+            max_messages: Optional limit on messages to retrieve (None for all,
+                0 for none)
 
         Returns:
             List of messages in chronological order
@@ -53,6 +54,26 @@ class IConversationStorage(ABC):
         """
         ...
 
+    async def save_initial(
+        self, conversation_id: str, state: ConversationState, message: ChatMessage
+    ) -> bool:
+        """
+        Save the initial state and first message of a new conversation.
+
+        Backends that can write both in one round trip should override this;
+        the default performs save_state() then save_message().
+
+        Args:
+            conversation_id: Unique conversation identifier
+            state: Initial conversation state
+            message: First message of the conversation
+
+        Returns:
+            True if successful
+        """
+        await self.save_state(conversation_id, state)
+        return await self.save_message(conversation_id, message)
+
     @abstractmethod
     async def get_state(self, conversation_id: str) -> Optional[ConversationState]:
         """
@@ -17,9 +17,13 @@ class ValidationContext:
     event_emitter: IEventEmitter | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result from one or more validation stages."""
+    """Result from one or more validation stages.
+
+    Slotted, since every stage run creates one that is then merged into the
+    pipeline's combined result.
+    """
 
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
@@ -27,7 +31,7 @@ class ValidationResult:
 
     @property
     def is_valid(self) -> bool:
-        return len(self.errors) == 0
+        return not self.errors
 
     def add_error(self, message: str) -> None:
         self.errors.append(message)
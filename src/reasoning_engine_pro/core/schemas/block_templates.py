@@ -194,18 +194,23 @@ def get_template_for_action(action_code: str) -> Optional[BlockTemplate]:
     return _action_template_map.get(action_code)
 
 
+_DISCOVERY_DATE_FORMAT = "%-m/%-d/%Y 11:59:59 PM"
+_DISCOVERY_LOOKBACK = timedelta(days=30)
+
+
 class DiscoveryBlockProcessor:
     """Handles CreateDiscoverySnapshot special defaults (dates, timezone)."""
 
     @staticmethod
-    def apply_defaults(block: Block) -> Block:
+    def apply_defaults(block: Block, now: Optional[datetime] = None) -> Block:
         """Fill in default dates, timezone, and application for discovery blocks.
 
-        Only modifies inputs that are empty or set to "null".
+        Only modifies inputs that are empty or set to "null". The date range
+        ends at ``now`` (the current time when omitted).
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        date_format = "%-m/%-d/%Y 11:59:59 PM"
+        end_date = now if now is not None else datetime.now()
+        start_date = end_date - _DISCOVERY_LOOKBACK
+        date_format = _DISCOVERY_DATE_FORMAT
 
         for inp in block.Inputs:
             value = inp.StaticValue
@@ -1,14 +1,32 @@
 """Rough token estimation for message lists."""
 
+from ..enums import MessageRole
 from ..schemas.messages import ChatMessage
 
+_CHARS_PER_TOKEN = 4
+# Per-message character overhead: the role name plus ~10 chars of framing.
+_ROLE_OVERHEAD = {role: len(role.value) + 10 for role in MessageRole}
+
 
 def estimate_tokens(messages: list[ChatMessage]) -> int:
     """Estimate token count. ~4 characters per token, +10 overhead per message."""
-    total = sum(len(m.content or "") + len(m.role.value) + 10 for m in messages)
-    return max(1, total // 4)
+    total = sum(len(m.content or "") + _ROLE_OVERHEAD[m.role] for m in messages)
+    return max(1, total // _CHARS_PER_TOKEN)
 
 
 def should_summarize(messages: list[ChatMessage], limit: int = 100_000) -> bool:
-    """Check if messages exceed the token limit and should be summarized."""
-    return estimate_tokens(messages) > limit
+    """Check if messages exceed the token limit and should be summarized.
+
+    Equivalent to ``estimate_tokens(messages) > limit`` but stops at the
+    first message that pushes the running estimate over the limit.
+    """
+    if limit < 1:
+        return True  # estimate_tokens() is always at least 1
+    # total // 4 > limit  <=>  total >= 4 * (limit + 1)
+    threshold = _CHARS_PER_TOKEN * (limit + 1)
+    total = 0
+    for m in messages:
+        total += len(m.content or "") + _ROLE_OVERHEAD[m.role]
+        if total >= threshold:
+            return True
+    return False
@@ -1,5 +1,6 @@
 """LLM Provider Factory."""
 
+from collections.abc import Callable
 from typing import Literal
 
 from ..config import Settings
@@ -8,6 +9,35 @@ from .providers.openai import OpenAIProvider
 from .providers.vllm import VLLMProvider
 
 
+def _build_vllm(
+    base_url: str, api_key: str, model_name: str, timeout: float
+) -> ILLMProvider:
+    return VLLMProvider(
+        base_url=base_url,
+        api_key=api_key,
+        model_name=model_name,
+        timeout=timeout,
+    )
+
+
+def _build_openai(
+    base_url: str, api_key: str, model_name: str, timeout: float
+) -> ILLMProvider:
+    # OpenAI uses the SDK's default endpoint; base_url is ignored.
+    return OpenAIProvider(
+        api_key=api_key,
+        model_name=model_name,
+        timeout=timeout,
+    )
+
+
+# Provider type -> builder; one dict lookup instead of an if/elif chain.
+_PROVIDER_BUILDERS: dict[str, Callable[[str, str, str, float], ILLMProvider]] = {
+    "vllm": _build_vllm,
+    "openai": _build_openai,
+}
+
+
 class LLMProviderFactory:
     """Factory for creating LLM providers."""
 
@@ -32,21 +62,10 @@ class LLMProviderFactory:
         Returns:
             LLM provider instance
         """
-        if provider_type == "vllm":
-            return VLLMProvider(
-                base_url=base_url,
-                api_key=api_key,
-                model_name=model_name,
-                timeout=timeout,
-            )
-        elif provider_type == "openai":
-            return OpenAIProvider(
-                api_key=api_key,
-                model_name=model_name,
-                timeout=timeout,
-            )
-        else:
+        build = _PROVIDER_BUILDERS.get(provider_type)
+        if build is None:
             raise ValueError(f"Unknown provider type: {provider_type}")
+        return build(base_url, api_key, model_name, timeout)
 
     @staticmethod
     def create_from_settings(settings: Settings) -> ILLMProvider:
@@ -1,6 +1,7 @@
 """Base LLM provider implementation."""
 
 import json
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from typing import Any, Optional
 
@@ -12,6 +13,14 @@ from ...core.exceptions import LLMProviderError
 from ...core.interfaces.llm_provider import ILLMProvider, LLMStreamChunk, ToolDefinition
 from ...core.schemas.messages import ChatMessage, ToolCall
 
+# Upper bound on cached message conversions per provider. Providers are shared
+# across conversations, so up to this many ChatMessages stay referenced (and
+# alive) after their request ends, until newer messages evict them.
+_OPENAI_MESSAGE_CACHE_SIZE = 1024
+
+# Role -> wire string, so conversion is a dict hit instead of Enum.value.
+_ROLE_STR: dict[MessageRole, str] = {role: role.value for role in MessageRole}
+
 
 class BaseLLMProvider(ILLMProvider):
     """Base implementation for OpenAI-compatible LLM providers."""
@@ -32,6 +41,10 @@ class BaseLLMProvider(ILLMProvider):
             api_key=api_key,
             timeout=timeout,
         )
+        # LRU keyed by id(message); see _OPENAI_MESSAGE_CACHE_SIZE for retention.
+        self._openai_message_cache: OrderedDict[
+            int, tuple[ChatMessage, dict[str, Any]]
+        ] = OrderedDict()
 
     @property
     def model_name(self) -> str:
@@ -47,40 +60,63 @@ class BaseLLMProvider(ILLMProvider):
         return self.__class__.__name__
 
     def _messages_to_openai(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
-        """Convert ChatMessages to OpenAI format."""
+        """Convert ChatMessages to OpenAI format.
+
+        Converted dicts are cached by message identity in a bounded LRU, so
+        the unchanged history prefix re-sent on every planner iteration is
+        converted once. Cache entries hold the message itself, which keeps
+        its id() from being reused while cached.
+        """
+        cache = self._openai_message_cache
         result = []
         for msg in messages:
-            openai_msg: dict[str, Any] = {"role": msg.role.value}
-
-            if msg.content is not None:
-                openai_msg["content"] = msg.content
-
-            if msg.tool_calls:
-                openai_msg["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": (
-                                json.dumps(tc.arguments)
-                                if isinstance(tc.arguments, dict)
-                                else tc.arguments
-                            ),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            if msg.tool_call_id:
-                openai_msg["tool_call_id"] = msg.tool_call_id
-
-            if msg.name:
-                openai_msg["name"] = msg.name
-
+            key = id(msg)
+            cached = cache.get(key)
+            if cached is not None and cached[0] is msg:
+                cache.move_to_end(key)
+                result.append(cached[1])
+                continue
+            openai_msg = self._message_to_openai(msg)
+            cache[key] = (msg, openai_msg)
+            cache.move_to_end(key)
+            if len(cache) > _OPENAI_MESSAGE_CACHE_SIZE:
+                cache.popitem(last=False)  # Evict the least recently used
             result.append(openai_msg)
         return result
 
+    @staticmethod
+    def _message_to_openai(msg: ChatMessage) -> dict[str, Any]:
+        """Convert a single ChatMessage to OpenAI format."""
+        openai_msg: dict[str, Any] = {"role": _ROLE_STR[msg.role]}
+
+        if msg.content is not None:
+            openai_msg["content"] = msg.content
+
+        if msg.tool_calls:
+            openai_msg["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": (
+                            json.dumps(tc.arguments)
+                            if isinstance(tc.arguments, dict)
+                            else tc.arguments
+                        ),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+
+        if msg.tool_call_id:
+            openai_msg["tool_call_id"] = msg.tool_call_id
+
+        if msg.name:
+            openai_msg["name"] = msg.name
+
+        return openai_msg
+
     def _tools_to_openai(
         self, tools: Optional[list[ToolDefinition]]
     ) -> Optional[list[dict[str, Any]]]:
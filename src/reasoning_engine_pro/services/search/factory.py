@@ -1,41 +1,111 @@
 """Search service factory."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Any
 
 from ...config import Settings
 from .task_block import TaskBlockSearchService
 from .web_search import WebSearchService
 
+if TYPE_CHECKING:
+    from .integrated.client import IntegratedSearchClient
+
 
 class SearchServiceFactory:
     """Factory for creating search services.
 
     Routes to the appropriate backend (legacy or integrated)
-    based on config settings.
+    based on config settings. Services and integrated clients are
+    memoized on the settings that shape them, so repeated calls reuse
+    the same instances and HTTP connection pools.
     """
 
-    _integrated_client: Optional["IntegratedSearchClient"] = None
+    _integrated_clients: dict[tuple[Any, ...], "IntegratedSearchClient"] = {}
+    _services: dict[tuple[Any, ...], Any] = {}
 
     @classmethod
-    def _get_or_create_integrated_client(cls, settings: Settings):
+    def _get_or_create_integrated_client(
+        cls, settings: Settings
+    ) -> "IntegratedSearchClient":
         """Get or create the shared integrated search client."""
-        if cls._integrated_client is None:
+        key = (
+            settings.integrated_search_url,
+            settings.integrated_search_api_key,
+            settings.integrated_search_timeout,
+        )
+        client = cls._integrated_clients.get(key)
+        if client is None:
             from .integrated.client import IntegratedSearchClient
 
-            cls._integrated_client = IntegratedSearchClient(
+            client = IntegratedSearchClient(
                 api_url=settings.integrated_search_url,
                 api_key=settings.integrated_search_api_key,
                 timeout=settings.integrated_search_timeout,
             )
-        return cls._integrated_client
+            cls._integrated_clients[key] = client
+        return client
 
-    @staticmethod
-    def create_web_search(settings: Settings):
+    @classmethod
+    def create_web_search(cls, settings: Settings):
         """Create web search service from settings."""
+        if settings.web_search_backend == "integrated":
+            key: tuple[Any, ...] = (
+                "web_search",
+                "integrated",
+                settings.integrated_search_url,
+                settings.integrated_search_api_key,
+                settings.integrated_search_timeout,
+                settings.integrated_web_search_max_results,
+                settings.integrated_web_search_model_type,
+            )
+        else:
+            key = (
+                "web_search",
+                settings.web_search_backend,
+                settings.web_search_api_url,
+                settings.web_search_api_key,
+                settings.web_search_model,
+                settings.web_search_max_tokens,
+            )
+        service = cls._services.get(key)
+        if service is None:
+            service = cls._build_web_search(settings)
+            cls._services[key] = service
+        return service
+
+    @classmethod
+    def create_task_block_search(cls, settings: Settings):
+        """Create task block search service from settings."""
+        if settings.task_block_search_backend == "integrated":
+            key: tuple[Any, ...] = (
+                "task_block_search",
+                "integrated",
+                settings.integrated_search_url,
+                settings.integrated_search_api_key,
+                settings.integrated_search_timeout,
+                settings.integrated_task_block_search_type,
+                settings.integrated_task_block_is_reason_required,
+                settings.integrated_elastic_task_block_size,
+            )
+        else:
+            key = (
+                "task_block_search",
+                settings.task_block_search_backend,
+                settings.task_block_search_url,
+                settings.task_block_search_api_key,
+            )
+        service = cls._services.get(key)
+        if service is None:
+            service = cls._build_task_block_search(settings)
+            cls._services[key] = service
+        return service
+
+    @classmethod
+    def _build_web_search(cls, settings: Settings):
+        """Build a new web search service for the configured backend."""
         if settings.web_search_backend == "integrated":
             from .integrated.web_search import IntegratedWebSearchService
 
-            client = SearchServiceFactory._get_or_create_integrated_client(settings)
+            client = cls._get_or_create_integrated_client(settings)
             return IntegratedWebSearchService(
                 client=client,
                 max_results=settings.integrated_web_search_max_results,
@@ -49,13 +119,13 @@ class SearchServiceFactory:
             max_tokens=settings.web_search_max_tokens,
         )
 
-    @staticmethod
-    def create_task_block_search(settings: Settings):
-        """Create task block search service from settings."""
+    @classmethod
+    def _build_task_block_search(cls, settings: Settings):
+        """Build a new task block search service for the configured backend."""
         if settings.task_block_search_backend == "integrated":
             from .integrated.task_block import IntegratedTaskBlockSearchService
 
-            client = SearchServiceFactory._get_or_create_integrated_client(settings)
+            client = cls._get_or_create_integrated_client(settings)
             return IntegratedTaskBlockSearchService(
                 client=client,
                 search_type=settings.integrated_task_block_search_type,
@@ -70,12 +140,14 @@ class SearchServiceFactory:
 
     @classmethod
     async def close_integrated_client(cls) -> None:
-        """Close the shared integrated client if it exists."""
-        if cls._integrated_client is not None:
-            await cls._integrated_client.close()
-            cls._integrated_client = None
+        """Close the shared integrated clients and drop cached services."""
+        clients = list(cls._integrated_clients.values())
+        cls.reset()
+        for client in clients:
+            await client.close()
 
     @classmethod
     def reset(cls) -> None:
         """Reset factory state (for testing)."""
-        cls._integrated_client = None
+        cls._integrated_clients = {}
+        cls._services = {}
@@ -1,5 +1,6 @@
 """Shared HTTP client for the integrated search endpoint."""
 
+import json
 from typing import Any, Optional
 
 import httpx
@@ -9,6 +10,14 @@ from ....observability.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive pool shared by every search call, so repeated tool calls reuse
+# open connections instead of paying a new TCP/TLS handshake each time.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
 
 class IntegratedSearchClient:
     """HTTP client for the integrated search endpoint.
@@ -33,6 +42,7 @@ class IntegratedSearchClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=self._timeout,
+                limits=_CONNECTION_LIMITS,
                 headers={
                     "Authorization": self._api_key,
                     "Content-Type": "application/json",
@@ -63,14 +73,17 @@ class IntegratedSearchClient:
 
         response = await client.post(self._api_url, json=request_body)
 
+        # Work from the raw bytes: response.text would decode the whole body
+        # just for the preview, and response.json() would decode it again.
+        body = response.content
         logger.debug(
             "Integrated search response",
             status_code=response.status_code,
-            body_preview=response.text[:500] if response.text else "",
+            body_preview=body[:500].decode("utf-8", errors="replace"),
         )
 
         response.raise_for_status()
-        return response.json()
+        return json.loads(body)
 
     async def close(self) -> None:
         """Close the shared HTTP client."""
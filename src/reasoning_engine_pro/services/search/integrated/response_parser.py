@@ -10,6 +10,8 @@ Python repr-style search result objects that need regex parsing.
 """
 
 import re
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from ....core.schemas.tools import TaskBlockSearchResult, WebSearchResult
@@ -17,6 +19,26 @@ from ....observability.logger import get_logger
 
 logger = get_logger(__name__)
 
+TaskBlockParser = Callable[[dict[str, Any], int], list[TaskBlockSearchResult]]
+
+_WEB_SECTION_TAG = "web_search"
+_ELASTIC_SECTION_TAG = "plain_elastic_task_block_search"
+_LLM_SECTION_TAG = "llm_task_block_search"
+
+# Patterns are compiled once at import; parsers run on every search tool call.
+_SECTION_RES: dict[str, re.Pattern[str]] = {
+    tag: re.compile(rf"<{re.escape(tag)}>\s*(.*?)\s*</{re.escape(tag)}>", re.DOTALL)
+    for tag in (_WEB_SECTION_TAG, _ELASTIC_SECTION_TAG, _LLM_SECTION_TAG)
+}
+_WEB_RESULT_RE = re.compile(r"SearchResult\(")
+_TASK_RESULT_RE = re.compile(r"TaskSearchResult\(")
+# One pass over a repr-style block captures every `name='..'`, `name=".."`
+# or `name=1.5` field; quoted values are consumed whole, so text inside
+# them is never mistaken for another field.
+_FIELD_RE = re.compile(
+    r"""(\w+)=(?:'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)"|([\d.]+))"""
+)
+
 
 def parse_web_search_results(
     response_data: dict[str, Any],
@@ -28,7 +50,7 @@ def parse_web_search_results(
         logger.warning("Unexpected response: content is not a string")
         return []
 
-    section = _extract_section(content, "web_search")
+    section = _extract_section(content, _WEB_SECTION_TAG)
     if not section:
         logger.warning(
             "No <web_search> section found in response",
@@ -37,15 +59,16 @@ def parse_web_search_results(
         return []
 
     results: list[WebSearchResult] = []
-    for match in re.finditer(r"SearchResult\(", section):
+    for match in _WEB_RESULT_RE.finditer(section):
         start = match.start()
         block = _extract_balanced_parens(section, start + len("SearchResult"))
         if not block:
             continue
 
-        title = _extract_field(block, "title") or ""
-        url = _extract_field(block, "url") or ""
-        snippet = _extract_field(block, "snippet") or ""
+        fields, _ = _extract_fields(block)
+        title = fields.get("title") or ""
+        url = fields.get("url") or ""
+        snippet = fields.get("snippet") or ""
 
         if title or url:
             results.append(WebSearchResult(
@@ -67,17 +90,39 @@ def parse_task_block_search_results(
     max_results: int = 10,
 ) -> list[TaskBlockSearchResult]:
     """Parse task block search results from integrated endpoint response."""
+    return make_task_block_parser(search_type)(response_data, max_results)
+
+
+def make_task_block_parser(search_type: str) -> TaskBlockParser:
+    """Build a task block parser with the search_type dispatch resolved once.
+
+    Services call this at construction time so each search skips the
+    per-call section-tag and result-shape branching.
+    """
+    section_tag = _ELASTIC_SECTION_TAG if search_type == "elastic" else _LLM_SECTION_TAG
+    return partial(
+        _parse_task_block_results,
+        search_type=search_type,
+        section_tag=section_tag,
+        llm_summary=search_type == "llm",
+    )
+
+
+def _parse_task_block_results(
+    response_data: dict[str, Any],
+    max_results: int = 10,
+    *,
+    search_type: str,
+    section_tag: str,
+    llm_summary: bool,
+) -> list[TaskBlockSearchResult]:
+    """Parse task block results from the pre-selected section."""
     content = response_data.get("content", "")
     if not isinstance(content, str):
         logger.warning("Unexpected response: content is not a string")
         return []
 
-    # Try the specific section tag based on search type
-    if search_type == "elastic":
-        section = _extract_section(content, "plain_elastic_task_block_search")
-    else:
-        section = _extract_section(content, "llm_task_block_search")
-
+    section = _extract_section(content, section_tag)
     if not section:
         logger.warning(
             "No task block search section found in response",
@@ -87,7 +132,7 @@ def parse_task_block_search_results(
         return []
 
     # LLM task block search returns plain text summary, not structured results
-    if search_type == "llm" and "TaskSearchResult(" not in section:
+    if llm_summary and "TaskSearchResult(" not in section:
         return [TaskBlockSearchResult(
             block_id="llm-summary",
             name="LLM Search Summary",
@@ -98,18 +143,19 @@ def parse_task_block_search_results(
 
     # Parse structured TaskSearchResult objects (elastic search format)
     results: list[TaskBlockSearchResult] = []
-    for match in re.finditer(r"TaskSearchResult\(", section):
+    for match in _TASK_RESULT_RE.finditer(section):
         start = match.start()
         block = _extract_balanced_parens(section, start + len("TaskSearchResult"))
         if not block:
             continue
 
-        block_id = _extract_field(block, "id") or ""
-        name = _extract_field(block, "name") or ""
-        action_code = _extract_field(block, "action_code") or ""
-        description = _extract_field(block, "description") or ""
-        score_str = _extract_numeric_field(block, "score") or "0"
-        similarity_str = _extract_numeric_field(block, "similarity") or "0"
+        fields, numbers = _extract_fields(block)
+        block_id = fields.get("id") or ""
+        name = fields.get("name") or ""
+        action_code = fields.get("action_code") or ""
+        description = fields.get("description") or ""
+        score_str = numbers.get("score") or "0"
+        similarity_str = numbers.get("similarity") or "0"
 
         results.append(TaskBlockSearchResult(
             block_id=block_id,
@@ -127,8 +173,10 @@ def parse_task_block_search_results(
 
 def _extract_section(content: str, tag: str) -> str | None:
     """Extract content between <tag>...</tag> from the response content string."""
-    pattern = rf"<{re.escape(tag)}>\s*(.*?)\s*</{re.escape(tag)}>"
-    match = re.search(pattern, content, re.DOTALL)
+    # Cheap substring check skips the regex when the section is absent.
+    if f"<{tag}>" not in content:
+        return None
+    match = _SECTION_RES[tag].search(content)
     return match.group(1) if match else None
 
 
@@ -147,22 +195,23 @@ def _extract_balanced_parens(text: str, start: int) -> str | None:
     return None
 
 
-def _extract_field(block: str, field_name: str) -> str | None:
-    """Extract a string field value from a repr-style block like `field='value'`."""
-    pattern = rf"{field_name}='((?:[^'\\]|\\.)*)'"
-    match = re.search(pattern, block)
-    if match:
-        return match.group(1).replace("\\'", "'").replace("\\n", "\n")
-    # Try double quotes
-    pattern = rf'{field_name}="((?:[^"\\]|\\.)*)"'
-    match = re.search(pattern, block)
-    if match:
-        return match.group(1).replace('\\"', '"').replace("\\n", "\n")
-    return None
-
+def _extract_fields(block: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Extract all fields of a repr-style block in a single scan.
 
-def _extract_numeric_field(block: str, field_name: str) -> str | None:
-    """Extract a numeric field value from a repr-style block like `field=0.95`."""
-    pattern = rf"{field_name}=([\d.]+)"
-    match = re.search(pattern, block)
-    return match.group(1) if match else None
+    Returns:
+        (string fields, numeric fields) keyed by field name; the first
+        occurrence of a name wins.
+    """
+    strings: dict[str, str] = {}
+    numbers: dict[str, str] = {}
+    for match in _FIELD_RE.finditer(block):
+        name, single_quoted, double_quoted, number = match.groups()
+        if name in strings or name in numbers:
+            continue
+        if single_quoted is not None:
+            strings[name] = single_quoted.replace("\\'", "'").replace("\\n", "\n")
+        elif double_quoted is not None:
+            strings[name] = double_quoted.replace('\\"', '"').replace("\\n", "\n")
+        else:
+            numbers[name] = number
+    return strings, numbers
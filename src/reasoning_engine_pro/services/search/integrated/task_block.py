@@ -9,7 +9,7 @@ from ....core.exceptions import ToolExecutionError
 from ....core.schemas.tools import TaskBlockSearchResult
 from ....observability.logger import get_logger
 from .client import IntegratedSearchClient
-from .response_parser import parse_task_block_search_results
+from .response_parser import make_task_block_parser
 
 logger = get_logger(__name__)
 
@@ -34,48 +34,46 @@ class IntegratedTaskBlockSearchService:
         self._search_type = search_type
         self._is_reason_required = is_reason_required
         self._elastic_size = elastic_size
+        self._parse = make_task_block_parser(search_type)
+        # Everything but the query is fixed per service; build it once.
+        # The API requires web_search=true as a primary flag;
+        # task block search alone returns an error.
+        self._body_template: dict[str, Any] = {
+            "web_search": True,
+            "rag_search": False,
+            "opkey_qdrant_search": False,
+            "web_search_tavily": False,
+            "llm_task_block_search": search_type == "llm",
+            "plain_elastic_task_block_search": search_type == "elastic",
+        }
+        self._web_search_params: dict[str, Any] = {
+            "max_results": 1,
+            "include_snippets": False,
+            "use_search_handler": True,
+            "use_reranker": False,
+            "summarize_content": False,
+            "model_type": "big",
+        }
+        self._search_params: dict[str, Any]
+        if search_type == "llm":
+            self._search_params_key = "llm_task_block_search_params"
+            self._search_params = {"is_reason_required": is_reason_required}
+        else:
+            self._search_params_key = "plain_elastic_task_block_search_params"
+            self._search_params = {"size": elastic_size}
 
     async def search(self, query: str) -> list[TaskBlockSearchResult]:
         """Search for task blocks via integrated endpoint."""
         try:
-            # The API requires web_search=true as a primary flag;
-            # task block search alone returns an error.
-            request_body: dict[str, Any] = {
-                "web_search": True,
-                "rag_search": False,
-                "opkey_qdrant_search": False,
-                "web_search_tavily": False,
-                "llm_task_block_search": self._search_type == "llm",
-                "plain_elastic_task_block_search": self._search_type == "elastic",
-                "web_search_params": {
-                    "query": query,
-                    "max_results": 1,
-                    "include_snippets": False,
-                    "use_search_handler": True,
-                    "use_reranker": False,
-                    "summarize_content": False,
-                    "model_type": "big",
-                },
+            request_body = {
+                **self._body_template,
+                "web_search_params": {"query": query, **self._web_search_params},
+                self._search_params_key: {"query": query, **self._search_params},
             }
 
-            if self._search_type == "llm":
-                request_body["llm_task_block_search_params"] = {
-                    "query": query,
-                    "is_reason_required": self._is_reason_required,
-                }
-            else:
-                request_body["plain_elastic_task_block_search_params"] = {
-                    "query": query,
-                    "size": self._elastic_size,
-                }
-
             response_data = await self._client.search(request_body)
 
-            return parse_task_block_search_results(
-                response_data,
-                search_type=self._search_type,
-                max_results=self._max_results,
-            )
+            return self._parse(response_data, self._max_results)
 
         except ToolExecutionError:
             raise
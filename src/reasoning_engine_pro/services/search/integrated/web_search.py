@@ -1,6 +1,7 @@
 """Web search service using the integrated search endpoint."""
 
 import json
+from typing import Any
 
 import httpx
 
@@ -29,26 +30,30 @@ class IntegratedWebSearchService:
         self._client = client
         self._max_results = max_results
         self._model_type = model_type
+        # Everything but the query is fixed per service; build it once.
+        self._body_template: dict[str, Any] = {
+            "web_search": True,
+            "rag_search": False,
+            "opkey_qdrant_search": False,
+            "web_search_tavily": False,
+            "llm_task_block_search": False,
+            "plain_elastic_task_block_search": False,
+        }
+        self._web_search_params: dict[str, Any] = {
+            "max_results": max_results,
+            "include_snippets": True,
+            "use_search_handler": True,
+            "use_reranker": False,
+            "summarize_content": False,
+            "model_type": model_type,
+        }
 
     async def search(self, query: str) -> list[WebSearchResult]:
         """Execute web search via integrated endpoint."""
         try:
             request_body = {
-                "web_search": True,
-                "rag_search": False,
-                "opkey_qdrant_search": False,
-                "web_search_tavily": False,
-                "llm_task_block_search": False,
-                "plain_elastic_task_block_search": False,
-                "web_search_params": {
-                    "query": query,
-                    "max_results": self._max_results,
-                    "include_snippets": True,
-                    "use_search_handler": True,
-                    "use_reranker": False,
-                    "summarize_content": False,
-                    "model_type": self._model_type,
-                },
+                **self._body_template,
+                "web_search_params": {"query": query, **self._web_search_params},
             }
 
             response_data = await self._client.search(request_body)
@@ -44,16 +44,19 @@ class InMemoryStorage(IConversationStorage):
     async def get_history(
         self, conversation_id: str, max_messages: Optional[int] = None
     ) -> list[ChatMessage]:
-        """Get conversation history."""
-        if self._is_expired(conversation_id):
+        """Get conversation history.
+
+        Returns a fresh list, matching the Redis backend, so callers may
+        edit it without touching stored history.
+        """
+        if max_messages == 0 or self._is_expired(conversation_id):
             return []
 
         messages = self._history.get(conversation_id, [])
-        if max_messages:
-            messages = messages[-max_messages:]
-
         self._extend_expiry(conversation_id, self._default_ttl)
-        return messages
+        if max_messages is not None:
+            return messages[-max_messages:]
+        return list(messages)
 
     async def save_state(self, conversation_id: str, state: ConversationState) -> bool:
         """Save conversation state."""
@@ -61,6 +64,15 @@ class InMemoryStorage(IConversationStorage):
         self._extend_expiry(conversation_id, self._default_ttl)
         return True
 
+    async def save_initial(
+        self, conversation_id: str, state: ConversationState, message: ChatMessage
+    ) -> bool:
+        """Save initial state and first message."""
+        self._state[conversation_id] = state
+        self._history.setdefault(conversation_id, []).append(message)
+        self._extend_expiry(conversation_id, self._default_ttl)
+        return True
+
     async def get_state(self, conversation_id: str) -> Optional[ConversationState]:
         """Get conversation state."""
         if self._is_expired(conversation_id):
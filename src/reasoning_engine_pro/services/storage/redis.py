@@ -85,13 +85,14 @@ class RedisStorage(IConversationStorage):
         self, conversation_id: str, max_messages: Optional[int] = None
     ) -> list[ChatMessage]:
         """Get conversation history."""
+        if max_messages == 0:
+            return []
+
         client = self._get_client()
         key = self.HISTORY_KEY.format(id=conversation_id)
 
-        if max_messages:
-            messages_json = await client.lrange(key, -max_messages, -1)
-        else:
-            messages_json = await client.lrange(key, 0, -1)
+        start = -max_messages if max_messages is not None else 0
+        messages_json = await client.lrange(key, start, -1)
 
         messages = [
             ChatMessage.model_validate_json(msg_json) for msg_json in messages_json
@@ -109,15 +110,37 @@ class RedisStorage(IConversationStorage):
         await client.set(key, state_json, ex=self._default_ttl)
         return True
 
+    @_storage_operation("save initial conversation")
+    async def save_initial(
+        self, conversation_id: str, state: ConversationState, message: ChatMessage
+    ) -> bool:
+        """Save initial state and first message in one MULTI/EXEC round trip."""
+        client = self._get_client()
+        state_key = self.STATE_KEY.format(id=conversation_id)
+        history_key = self.HISTORY_KEY.format(id=conversation_id)
+
+        pipe = client.pipeline(transaction=True)
+        pipe.set(state_key, state.model_dump_json(), ex=self._default_ttl)
+        pipe.rpush(history_key, message.model_dump_json())
+        pipe.expire(history_key, self._default_ttl)
+        await pipe.execute()
+        return True
+
     @_storage_operation("get state")
     async def get_state(self, conversation_id: str) -> Optional[ConversationState]:
         """Get conversation state."""
         client = self._get_client()
         key = self.STATE_KEY.format(id=conversation_id)
-        state_json = await client.get(key)
+
+        # Read and refresh TTL in one round trip; EXPIRE on a missing key
+        # is a no-op.
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, self._default_ttl)
+        state_json, _ = await pipe.execute()
+
         if state_json is None:
             return None
-        await client.expire(key, self._default_ttl)
         return ConversationState.model_validate_json(state_json)
 
     @_storage_operation("save draft")
@@ -145,10 +168,10 @@ class RedisStorage(IConversationStorage):
             self.DRAFT_KEY.format(id=conversation_id),
             self.EVENTS_KEY.format(id=conversation_id),
         ]
-        async with client.pipeline() as pipe:
-            for key in keys:
-                await pipe.expire(key, ttl_seconds)
-            await pipe.execute()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.expire(key, ttl_seconds)
+        await pipe.execute()
         return True
 
     @_storage_operation("delete conversation")
@@ -131,20 +131,21 @@ SUBMIT_WORKFLOW_DEFINITION = ToolDefinition(
     },
 )
 
-# All tool definitions
-TOOL_DEFINITIONS = [
+# All tool definitions (immutable, built once at import)
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = (
     WEB_SEARCH_DEFINITION,
     TASK_BLOCK_SEARCH_DEFINITION,
     CLARIFY_DEFINITION,
     THINK_APPROACH_DEFINITION,
     PRESENT_ANSWER_DEFINITION,
     SUBMIT_WORKFLOW_DEFINITION,
-]
+)
+
+_TOOL_DEFINITIONS_BY_NAME: dict[str, ToolDefinition] = {
+    tool.name: tool for tool in TOOL_DEFINITIONS
+}
 
 
 def get_tool_definition(name: str) -> ToolDefinition | None:
     """Get a tool definition by name."""
-    for tool in TOOL_DEFINITIONS:
-        if tool.name == name:
-            return tool
-    return None
+    return _TOOL_DEFINITIONS_BY_NAME.get(name)
@@ -2,7 +2,10 @@
 
 from .base import BaseToolExecutor
 from .clarify import ClarifyExecutor
+from .present_answer import PresentAnswerExecutor
+from .submit_workflow import SubmitWorkflowExecutor
 from .task_block_search import TaskBlockSearchExecutor
+from .think_approach import ThinkApproachExecutor
 from .web_search import WebSearchExecutor
 
 __all__ = [
@@ -10,4 +13,7 @@ __all__ = [
     "WebSearchExecutor",
     "TaskBlockSearchExecutor",
     "ClarifyExecutor",
+    "ThinkApproachExecutor",
+    "PresentAnswerExecutor",
+    "SubmitWorkflowExecutor",
 ]
@@ -1,6 +1,9 @@
 """Base tool executor implementation."""
 
+import asyncio
 from abc import abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
@@ -9,6 +12,36 @@ from ...core.interfaces.tool_executor import IToolExecutor
 
 TInput = TypeVar("TInput", bound=BaseModel)
 TOutput = TypeVar("TOutput", bound=BaseModel)
+TResult = TypeVar("TResult")
+
+# Upper bound on search calls a single tool invocation keeps in flight.
+DEFAULT_SEARCH_CONCURRENCY = 5
+
+
+async def run_searches(
+    search: Callable[[str], Awaitable[list[TResult]]],
+    queries: Sequence[str],
+    max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+) -> list[list[TResult]]:
+    """Run ``search`` for each query, at most ``max_concurrency`` at a time.
+
+    Returns one result batch per query, in query order. If a search fails,
+    the remaining ones are cancelled and the first failure is re-raised
+    as-is rather than wrapped in an ExceptionGroup.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _search_one(query: str) -> list[TResult]:
+        async with semaphore:
+            return await search(query)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_search_one(query)) for query in queries]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+
+    return [task.result() for task in tasks]
 
 
 class BaseToolExecutor(IToolExecutor[TInput, TOutput], Generic[TInput, TOutput]):
@@ -44,7 +77,11 @@ class BaseToolExecutor(IToolExecutor[TInput, TOutput], Generic[TInput, TOutput])
         ...
 
     def to_openai_function(self) -> dict[str, Any]:
-        """Convert to OpenAI function format."""
+        """Convert to OpenAI function format (built once per executor)."""
+        return self._openai_function
+
+    @cached_property
+    def _openai_function(self) -> dict[str, Any]:
         schema = self.input_schema.model_json_schema()
 
         # Remove title and description from root schema
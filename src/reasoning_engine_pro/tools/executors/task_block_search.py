@@ -7,7 +7,7 @@ from ...core.schemas.tools import (
     TaskBlockSearchOutput,
     TaskBlockSearchResult,
 )
-from .base import BaseToolExecutor
+from .base import DEFAULT_SEARCH_CONCURRENCY, BaseToolExecutor, run_searches
 
 if TYPE_CHECKING:
     from ...services.search.task_block import TaskBlockSearchService
@@ -18,7 +18,11 @@ class TaskBlockSearchExecutor(
 ):
     """Executor for task block search tool."""
 
-    def __init__(self, search_service: "TaskBlockSearchService"):
+    def __init__(
+        self,
+        search_service: "TaskBlockSearchService",
+        max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+    ):
         super().__init__(
             name="task_block_search",
             description=(
@@ -27,6 +31,7 @@ class TaskBlockSearchExecutor(
             ),
         )
         self._search_service = search_service
+        self._max_concurrency = max_concurrency
 
     @property
     def input_schema(self) -> type[TaskBlockSearchInput]:
@@ -38,20 +43,17 @@ class TaskBlockSearchExecutor(
 
     async def execute(self, input_data: TaskBlockSearchInput) -> TaskBlockSearchOutput:
         """Execute task block search queries."""
-        all_results: list[TaskBlockSearchResult] = []
-
-        for query in input_data.queries:
-            results = await self._search_service.search(query)
-            all_results.extend(results)
+        batches = await run_searches(
+            self._search_service.search, input_data.queries, self._max_concurrency
+        )
 
-        # Deduplicate by block_id, keeping highest relevance score
+        # Deduplicate by block_id while reducing, keeping highest relevance score
         seen: dict[str, TaskBlockSearchResult] = {}
-        for result in all_results:
-            if (
-                result.block_id not in seen
-                or result.relevance_score > seen[result.block_id].relevance_score
-            ):
-                seen[result.block_id] = result
+        for batch in batches:
+            for result in batch:
+                current = seen.get(result.block_id)
+                if current is None or result.relevance_score > current.relevance_score:
+                    seen[result.block_id] = result
 
         unique_results = list(seen.values())
         unique_results.sort(key=lambda x: x.relevance_score, reverse=True)
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING
 
 from ...core.schemas.tools import WebSearchInput, WebSearchOutput, WebSearchResult
-from .base import BaseToolExecutor
+from .base import DEFAULT_SEARCH_CONCURRENCY, BaseToolExecutor, run_searches
 
 if TYPE_CHECKING:
     from ...services.search.web_search import WebSearchService
@@ -12,7 +12,11 @@ if TYPE_CHECKING:
 class WebSearchExecutor(BaseToolExecutor[WebSearchInput, WebSearchOutput]):
     """Executor for web search tool."""
 
-    def __init__(self, search_service: "WebSearchService"):
+    def __init__(
+        self,
+        search_service: "WebSearchService",
+        max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+    ):
         super().__init__(
             name="web_search",
             description=(
@@ -21,6 +25,7 @@ class WebSearchExecutor(BaseToolExecutor[WebSearchInput, WebSearchOutput]):
             ),
         )
         self._search_service = search_service
+        self._max_concurrency = max_concurrency
 
     @property
     def input_schema(self) -> type[WebSearchInput]:
@@ -32,11 +37,14 @@ class WebSearchExecutor(BaseToolExecutor[WebSearchInput, WebSearchOutput]):
 
     async def execute(self, input_data: WebSearchInput) -> WebSearchOutput:
         """Execute web search queries."""
-        all_results: list[WebSearchResult] = []
-
-        for query in input_data.queries:
-            results = await self._search_service.search(query)
-            all_results.extend(results)
+        # Queries are independent; run them concurrently. Results keep query
+        # order, and the first search failure still propagates to the caller.
+        batches = await run_searches(
+            self._search_service.search, input_data.queries, self._max_concurrency
+        )
+        all_results: list[WebSearchResult] = [
+            result for batch in batches for result in batch
+        ]
 
         return WebSearchOutput(
             results=all_results,
@@ -1,6 +1,10 @@
 """Tool Factory for creating and registering tools."""
 
+from collections.abc import Callable
+from typing import Any
+
 from ..config import Settings
+from ..core.interfaces.tool_executor import IToolExecutor
 from ..services.search.factory import SearchServiceFactory
 from .executors.clarify import ClarifyExecutor
 from .executors.present_answer import PresentAnswerExecutor
@@ -10,31 +14,50 @@ from .executors.think_approach import ThinkApproachExecutor
 from .executors.web_search import WebSearchExecutor
 from .registry import ToolRegistry
 
+# Tools are registered in table order, most frequently called first. Registry
+# iteration follows insertion order, so keep that ordering when adding tools.
+
+# Executors that wrap a search service, paired with the builder for that service.
+_SEARCH_TOOL_SPECS: tuple[
+    tuple[Callable[[Any], IToolExecutor[Any, Any]], Callable[[Settings], Any]], ...
+] = (
+    (WebSearchExecutor, SearchServiceFactory.create_web_search),
+    (TaskBlockSearchExecutor, SearchServiceFactory.create_task_block_search),
+)
+
+# Executors without dependencies hold no per-conversation state, so one
+# instance of each is shared by every registry.
+_STATELESS_EXECUTORS = (
+    ThinkApproachExecutor(),
+    ClarifyExecutor(),
+    PresentAnswerExecutor(),
+    SubmitWorkflowExecutor(),
+)
+
 
 class ToolFactory:
     """Factory for creating and registering tool executors."""
 
-    @staticmethod
-    def create_all(settings: Settings) -> ToolRegistry:
+    @classmethod
+    def create_all(cls, settings: Settings) -> ToolRegistry:
         """
         Create all tools and register them.
 
+        Search services come from SearchServiceFactory, which memoizes them
+        (and their HTTP client pools) across calls.
+
         Args:
             settings: Application settings
 
         Returns:
             Configured ToolRegistry
         """
-        registry = ToolRegistry()
-
-        web_search_service = SearchServiceFactory.create_web_search(settings)
-        task_block_service = SearchServiceFactory.create_task_block_search(settings)
+        registry = ToolRegistry.get_instance()
 
-        registry.register(WebSearchExecutor(web_search_service))
-        registry.register(TaskBlockSearchExecutor(task_block_service))
-        registry.register(ClarifyExecutor())
-        registry.register(ThinkApproachExecutor())
-        registry.register(PresentAnswerExecutor())
-        registry.register(SubmitWorkflowExecutor())
+        registry.register_many(
+            executor_cls(build_service(settings))
+            for executor_cls, build_service in _SEARCH_TOOL_SPECS
+        )
+        registry.register_many(_STATELESS_EXECUTORS)
 
         return registry
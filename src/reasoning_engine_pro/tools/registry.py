@@ -1,5 +1,6 @@
 """Tool Registry - singleton pattern for tool management."""
 
+from collections.abc import Iterable
 from typing import Any
 
 from ..core.enums import ToolType
@@ -9,13 +10,26 @@ from ..core.interfaces.tool_executor import IToolExecutor
 class ToolRegistry:
     """Registry for managing tool executors."""
 
+    __slots__ = (
+        "_executors",
+        "_executors_by_type",
+        "_names_cache",
+        "_definitions_cache",
+    )
+
     _instance: "ToolRegistry | None" = None
-    _executors: dict[str, IToolExecutor[Any, Any]]
 
-    def __new__(cls) -> "ToolRegistry":
+    def __init__(self) -> None:
+        self._executors: dict[str, IToolExecutor[Any, Any]] = {}
+        self._executors_by_type: dict[ToolType, IToolExecutor[Any, Any]] = {}
+        self._names_cache: tuple[str, ...] | None = None
+        self._definitions_cache: tuple[dict[str, Any], ...] | None = None
+
+    @classmethod
+    def get_instance(cls) -> "ToolRegistry":
+        """Get or create the shared registry instance."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._executors = {}
+            cls._instance = cls()
         return cls._instance
 
     def register(self, executor: IToolExecutor[Any, Any]) -> None:
@@ -25,12 +39,34 @@ class ToolRegistry:
         Args:
             executor: Tool executor instance
         """
-        self._executors[executor.tool_name] = executor
+        self.register_many((executor,))
+
+    def register_many(self, executors: Iterable[IToolExecutor[Any, Any]]) -> None:
+        """
+        Register several tool executors, invalidating cached definitions once.
+
+        Args:
+            executors: Tool executor instances
+        """
+        by_name = self._executors
+        by_type = self._executors_by_type
+        for executor in executors:
+            name = executor.tool_name
+            by_name[name] = executor
+            try:
+                by_type[ToolType(name)] = executor
+            except ValueError:
+                pass  # Output tools have no ToolType member
+        self._names_cache = None
+        self._definitions_cache = None
 
     def get(self, tool_name: str) -> IToolExecutor[Any, Any] | None:
         """
         Get a tool executor by name.
 
+        String-keyed path for tool names that arrive from LLM tool calls;
+        callers holding a ToolType should use get_by_type().
+
         Args:
             tool_name: Name of the tool
 
@@ -43,25 +79,41 @@ class ToolRegistry:
         """
         Get a tool executor by ToolType enum.
 
+        Reads the enum-keyed index directly, with no fallback through get().
+
         Args:
             tool_type: ToolType enum value
 
         Returns:
             Tool executor or None if not found
         """
-        return self._executors.get(tool_type.value)
+        return self._executors_by_type.get(tool_type)
+
+    def list_tools(self) -> tuple[str, ...]:
+        """Get registered tool names (cached until the registry changes)."""
+        if self._names_cache is None:
+            self._names_cache = tuple(self._executors)
+        return self._names_cache
 
-    def list_tools(self) -> list[str]:
-        """Get list of registered tool names."""
-        return list(self._executors.keys())
+    def get_all_definitions(self) -> tuple[dict[str, Any], ...]:
+        """Get OpenAI function definitions for all registered tools.
 
-    def get_all_definitions(self) -> list[dict[str, Any]]:
-        """Get OpenAI function definitions for all registered tools."""
-        return [executor.to_openai_function() for executor in self._executors.values()]
+        The definitions are built once and cached until the registry changes.
+        The dicts are each executor's own cached definition, shared with every
+        registry holding that executor, so callers must not mutate them.
+        """
+        if self._definitions_cache is None:
+            self._definitions_cache = tuple(
+                executor.to_openai_function() for executor in self._executors.values()
+            )
+        return self._definitions_cache
 
     def clear(self) -> None:
         """Clear all registered executors (useful for testing)."""
         self._executors.clear()
+        self._executors_by_type.clear()
+        self._names_cache = None
+        self._definitions_cache = None
 
     @classmethod
     def reset(cls) -> None:
@@ -1,32 +1,35 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Generator
 
 import pytest
 from fastapi.testclient import TestClient
 
 from reasoning_engine_pro.api.app import create_app
+from reasoning_engine_pro.api.dependencies import Dependencies
 from reasoning_engine_pro.config import Settings
-from reasoning_engine_pro.core.enums import MessageRole
+from reasoning_engine_pro.core.enums import EventType, MessageRole
+from reasoning_engine_pro.core.interfaces.llm_provider import LLMStreamChunk
 from reasoning_engine_pro.core.schemas.messages import ChatMessage
 from reasoning_engine_pro.core.schemas.workflow import Workflow
 from reasoning_engine_pro.services.storage.memory import InMemoryStorage
 from tests.fixtures.sample_workflows import SampleWorkflows
 
+try:
+    # Installed with uvicorn[standard] everywhere except Windows/PyPy.
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+if uvloop is not None:
 
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop instead of the stdlib selector loop."""
+        return {"uvloop": uvloop.new_event_loop}
 
-@pytest.fixture
-def test_settings() -> Settings:
-    """Create test settings."""
+
+def _build_test_settings() -> Settings:
     return Settings(
         planner_llm_provider="vllm",
         planner_llm_base_url="http://localhost:8000/v1",
@@ -37,6 +40,18 @@ def test_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def app_settings() -> Settings:
+    """Create settings shared by app-level fixtures; treat as read-only."""
+    return _build_test_settings()
+
+
+@pytest.fixture
+def test_settings(app_settings: Settings) -> Settings:
+    """Create test settings; a per-test copy, so tests may mutate fields."""
+    return app_settings.model_copy()
+
+
 @pytest.fixture
 def memory_storage() -> InMemoryStorage:
     """Create in-memory storage for testing."""
@@ -60,48 +75,83 @@ def sample_messages() -> list[ChatMessage]:
     ]
 
 
+# Shared mock responses; tests read but never mutate them.
+_TEST_CHUNK = LLMStreamChunk(content="Test response", is_complete=True)
+_TEST_MESSAGE = ChatMessage(role=MessageRole.ASSISTANT, content="Test response")
+
+
+async def _mock_generate_stream(*args, **kwargs) -> AsyncGenerator[LLMStreamChunk, None]:
+    """Yield a simple streamed response."""
+    yield _TEST_CHUNK
+
+
+async def _mock_generate(*args, **kwargs) -> ChatMessage:
+    """Return a simple complete response."""
+    return _TEST_MESSAGE
+
+
+@pytest.fixture
+def mock_llm_provider() -> SimpleNamespace:
+    """Create a stub LLM provider; tests may replace generate per case."""
+    return SimpleNamespace(
+        model_name="test-model",
+        supports_function_calling=True,
+        generate_stream=_mock_generate_stream,
+        generate=_mock_generate,
+    )
+
+
 @pytest.fixture
-def mock_llm_provider() -> MagicMock:
-    """Create a mock LLM provider."""
-    provider = MagicMock()
-    provider.model_name = "test-model"
-    provider.supports_function_calling = True
+def failing_llm_provider(mock_llm_provider: SimpleNamespace) -> SimpleNamespace:
+    """Make mock_llm_provider.generate raise, for fallback-path tests."""
 
-    async def mock_generate_stream(*args, **kwargs):
-        # Yield a simple response
-        from reasoning_engine_pro.core.interfaces.llm_provider import LLMStreamChunk
+    async def generate(*args, **kwargs) -> ChatMessage:
+        raise RuntimeError("LLM unavailable")
 
-        yield LLMStreamChunk(content="Test response", is_complete=True)
+    mock_llm_provider.generate = generate
+    return mock_llm_provider
 
-    provider.generate_stream = mock_generate_stream
 
-    async def mock_generate(*args, **kwargs):
-        return ChatMessage(
-            role=MessageRole.ASSISTANT,
-            content="Test response",
-        )
+class _RecordingEmitter:
+    """Event emitter stub that records (event_type, payload) for each emit()."""
 
-    provider.generate = mock_generate
+    def __init__(self) -> None:
+        self.events: list[tuple[EventType, dict[str, Any]]] = []
 
-    return provider
+    async def emit(self, event_type: EventType, payload: dict[str, Any]) -> None:
+        self.events.append((event_type, payload))
 
 
 @pytest.fixture
-def test_client(test_settings: Settings) -> Generator[TestClient, None, None]:
-    """Create test client for API testing."""
-    from reasoning_engine_pro.api.dependencies import Dependencies
+def mock_emitter() -> _RecordingEmitter:
+    """Create a stub event emitter that records emit() calls."""
+    return _RecordingEmitter()
+
 
-    # Reset singleton
+@pytest.fixture(scope="session")
+def _app_client(
+    app_settings: Settings,
+) -> Generator[tuple[TestClient, Dependencies], None, None]:
+    """Create the app and its test client once per test session."""
     Dependencies.reset()
 
-    app = create_app(test_settings)
+    app = create_app(app_settings)
     with TestClient(app) as client:
-        yield client
+        yield client, Dependencies.get_instance()
 
-    # Cleanup
     Dependencies.reset()
 
 
+@pytest.fixture
+def test_client(
+    _app_client: tuple[TestClient, Dependencies],
+) -> Generator[TestClient, None, None]:
+    """Get the shared test client; conversation state is cleared after each test."""
+    client, deps = _app_client
+    yield client
+    deps.reset_state()
+
+
 @pytest.fixture
 async def async_memory_storage() -> AsyncGenerator[InMemoryStorage, None]:
     """Create async in-memory storage."""
@@ -2,6 +2,55 @@
 
 import json
 
+# Responses are deterministic, so the JSON is serialized once at import.
+_WORKFLOW = {
+    "workflow_json": [
+        {
+            "BlockId": "B001",
+            "Name": "Start",
+            "ActionCode": "Start",
+            "Inputs": [],
+            "Outputs": [],
+        },
+        {
+            "BlockId": "B002",
+            "Name": "Export HCM Config",
+            "ActionCode": "ExportConfigurations",
+            "Inputs": [
+                {"Name": "Module", "StaticValue": "HCM"},
+            ],
+            "Outputs": [
+                {
+                    "Name": "ConfigFile",
+                    "OutputVariableName": "op-B002-ConfigFile",
+                },
+            ],
+        },
+    ],
+    "edges": [
+        {"EdgeID": "E001", "From": "B001", "To": "B002"},
+    ],
+}
+
+_WORKFLOW_RESPONSE = f"""Based on your request, here's the workflow:
+
+```json
+{json.dumps(_WORKFLOW, indent=2)}
+```
+
+This workflow will export HCM configuration."""
+
+_CLARIFY_ARGUMENTS = json.dumps(
+    {
+        "questions": [
+            "Which specific HCM module do you want to export?",
+            "What format should the export be in?",
+        ]
+    }
+)
+_WEB_SEARCH_ARGUMENTS = json.dumps({"queries": ["HCM configuration export best practices"]})
+_TASK_BLOCK_SEARCH_ARGUMENTS = json.dumps({"queries": ["export configurations"]})
+
 
 class MockLLMResponses:
     """Collection of mock LLM responses."""
@@ -14,42 +63,7 @@ class MockLLMResponses:
     @staticmethod
     def workflow_response() -> str:
         """Response with workflow JSON."""
-        workflow = {
-            "workflow_json": [
-                {
-                    "BlockId": "B001",
-                    "Name": "Start",
-                    "ActionCode": "Start",
-                    "Inputs": [],
-                    "Outputs": [],
-                },
-                {
-                    "BlockId": "B002",
-                    "Name": "Export HCM Config",
-                    "ActionCode": "ExportConfigurations",
-                    "Inputs": [
-                        {"Name": "Module", "StaticValue": "HCM"},
-                    ],
-                    "Outputs": [
-                        {
-                            "Name": "ConfigFile",
-                            "OutputVariableName": "op-B002-ConfigFile",
-                        },
-                    ],
-                },
-            ],
-            "edges": [
-                {"EdgeID": "E001", "From": "B001", "To": "B002"},
-            ],
-        }
-
-        return f"""Based on your request, here's the workflow:
-
-```json
-{json.dumps(workflow, indent=2)}
-```
-
-This workflow will export HCM configuration."""
+        return _WORKFLOW_RESPONSE
 
     @staticmethod
     def clarification_response() -> dict:
@@ -58,14 +72,7 @@ This workflow will export HCM configuration."""
             "id": "call_123",
             "function": {
                 "name": "clarify",
-                "arguments": json.dumps(
-                    {
-                        "questions": [
-                            "Which specific HCM module do you want to export?",
-                            "What format should the export be in?",
-                        ]
-                    }
-                ),
+                "arguments": _CLARIFY_ARGUMENTS,
             },
         }
 
@@ -76,9 +83,7 @@ This workflow will export HCM configuration."""
             "id": "call_456",
             "function": {
                 "name": "web_search",
-                "arguments": json.dumps(
-                    {"queries": ["HCM configuration export best practices"]}
-                ),
+                "arguments": _WEB_SEARCH_ARGUMENTS,
             },
         }
 
@@ -89,6 +94,6 @@ This workflow will export HCM configuration."""
             "id": "call_789",
             "function": {
                 "name": "task_block_search",
-                "arguments": json.dumps({"queries": ["export configurations"]}),
+                "arguments": _TASK_BLOCK_SEARCH_ARGUMENTS,
             },
         }
@@ -62,6 +62,41 @@ class TestRedisStorage:
         assert retrieved.conversation_id == "conv-123"
         assert retrieved.status == ConversationStatus.ACTIVE
 
+    @pytest.mark.asyncio
+    async def test_save_initial(self, storage):
+        """Test saving initial state and first message together."""
+        state = ConversationState(conversation_id="conv-123")
+        msg = ChatMessage(role=MessageRole.USER, content="Hello")
+
+        assert await storage.save_initial("conv-123", state, msg) is True
+
+        assert (await storage.get_state("conv-123")).conversation_id == "conv-123"
+        history = await storage.get_history("conv-123")
+        assert [m.content for m in history] == ["Hello"]
+
+        client = storage._get_client()
+        assert await client.ttl("conv:conv-123:history") > 0
+
+    @pytest.mark.asyncio
+    async def test_get_state_missing_does_not_create_key(self, storage):
+        """Test reading a missing state returns None and leaves no key behind."""
+        assert await storage.get_state("conv-missing") is None
+
+        client = storage._get_client()
+        assert await client.exists("conv:conv-missing:state") == 0
+
+    @pytest.mark.asyncio
+    async def test_get_state_refreshes_ttl(self, storage):
+        """Test reading state refreshes its TTL."""
+        state = ConversationState(conversation_id="conv-123")
+        await storage.save_state("conv-123", state)
+
+        client = storage._get_client()
+        await client.expire("conv:conv-123:state", 10)
+
+        assert await storage.get_state("conv-123") is not None
+        assert await client.ttl("conv:conv-123:state") > 10
+
     @pytest.mark.asyncio
     async def test_save_and_get_draft(self, storage):
         """Test saving and retrieving draft."""
@@ -111,6 +146,20 @@ class TestRedisStorage:
         assert await storage.exists("conv-123") is False
         assert await storage.get_draft("conv-123") is None
 
+    @pytest.mark.asyncio
+    async def test_extend_ttl(self, storage):
+        """Test extending TTL across conversation keys."""
+        msg = ChatMessage(role=MessageRole.USER, content="Test message")
+        await storage.save_message("conv-123", msg)
+        await storage.save_draft("conv-123", "Draft")
+
+        result = await storage.extend_ttl("conv-123", 7200)
+        assert result is True
+
+        client = storage._get_client()
+        assert await client.ttl("conv:conv-123:history") > 3600
+        assert await client.ttl("conv:conv-123:draft") > 3600
+
     @pytest.mark.asyncio
     async def test_get_history_with_limit(self, storage):
         """Test retrieving limited message history."""
@@ -127,6 +176,15 @@ class TestRedisStorage:
         assert history[0].content == "Message 2"
         assert history[2].content == "Message 4"
 
+    @pytest.mark.asyncio
+    async def test_get_history_with_zero_limit(self, storage):
+        """Test a zero limit returns no messages rather than the full history."""
+        msg = ChatMessage(role=MessageRole.USER, content="Test message")
+        await storage.save_message("conv-123", msg)
+
+        assert await storage.get_history("conv-123", max_messages=0) == []
+        assert len(await storage.get_history("conv-123", max_messages=None)) == 1
+
     @pytest.mark.asyncio
     async def test_clarification_flow(self, storage):
         """Test clarification request/response flow."""
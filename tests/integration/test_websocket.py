@@ -1,84 +1,100 @@
 """Integration tests for WebSocket API."""
 
+import json
+from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from starlette.testclient import WebSocketTestSession
 
-from reasoning_engine_pro.api.app import create_app
+from reasoning_engine_pro.api.dependencies import Dependencies
 
+pytestmark = pytest.mark.integration
 
-class TestWebSocketEndpoint:
-    """Integration tests for WebSocket endpoint."""
+# Encoded once; heartbeat frames are identical across tests.
+_PING_FRAME = json.dumps({"event": "ping", "payload": {}})
 
-    @pytest.fixture
-    def client(self, test_settings):
-        """Create test client."""
-        from reasoning_engine_pro.api.dependencies import Dependencies
 
-        Dependencies.reset()
+@pytest.fixture(scope="class")
+def ws(
+    _app_client: tuple[TestClient, Dependencies],
+) -> Generator[WebSocketTestSession, None, None]:
+    """Open one WebSocket shared by a class's stateless request/response tests."""
+    client, _ = _app_client
+    with client.websocket_connect("/ws") as websocket:
+        yield websocket
 
-        app = create_app(test_settings)
-        with TestClient(app) as client:
-            yield client
 
-        Dependencies.reset()
+class TestWebSocketEndpoint:
+    """Integration tests for WebSocket endpoint."""
 
-    def test_websocket_connect(self, client):
+    def test_websocket_connect(self, test_client):
         """Test WebSocket connection."""
-        with client.websocket_connect("/ws") as websocket:
+        with test_client.websocket_connect("/ws") as websocket:
             # Connection should succeed
             assert websocket is not None
 
-    def test_websocket_ping_pong(self, client):
+    def test_websocket_ping_pong(self, ws):
         """Test ping/pong heartbeat."""
-        with client.websocket_connect("/ws") as websocket:
-            # Send ping
-            websocket.send_json({"event": "ping", "payload": {}})
+        # Send ping
+        ws.send_text(_PING_FRAME)
 
-            # Receive pong
-            response = websocket.receive_json()
-            assert response["event"] == "pong"
+        # Receive pong
+        response = ws.receive_json()
+        assert response["event"] == "pong"
 
-    def test_websocket_unknown_event(self, client):
+    def test_websocket_unknown_event(self, ws):
         """Test unknown event handling."""
-        with client.websocket_connect("/ws") as websocket:
-            # Send unknown event
-            websocket.send_json({"event": "unknown_event", "payload": {}})
+        # Send unknown event
+        ws.send_json({"event": "unknown_event", "payload": {}})
 
-            # Should receive error
-            response = websocket.receive_json()
-            assert response["event"] == "error"
-            assert "UNKNOWN_EVENT" in response["payload"]["error_code"]
+        # Should receive error
+        response = ws.receive_json()
+        assert response["event"] == "error"
+        assert "UNKNOWN_EVENT" in response["payload"]["error_code"]
 
-    def test_websocket_start_chat_missing_chat_id(self, client):
+    def test_websocket_start_chat_missing_chat_id(self, ws):
         """Test start_chat without chat_id."""
-        with client.websocket_connect("/ws") as websocket:
-            # Send start_chat without chat_id
-            websocket.send_json(
-                {
-                    "event": "start_chat",
-                    "payload": {"message": "Hello"},
-                }
-            )
-
-            # Should receive error
-            response = websocket.receive_json()
-            assert response["event"] == "error"
-            assert "chat_id" in response["payload"]["message"].lower()
-
-    def test_websocket_start_chat_missing_message(self, client):
+        # Send start_chat without chat_id
+        ws.send_json(
+            {
+                "event": "start_chat",
+                "payload": {"message": "Hello"},
+            }
+        )
+
+        # Should receive error
+        response = ws.receive_json()
+        assert response["event"] == "error"
+        assert "chat_id" in response["payload"]["message"].lower()
+
+    def test_websocket_start_chat_missing_message(self, ws):
         """Test start_chat without message."""
-        with client.websocket_connect("/ws") as websocket:
-            # Send start_chat without message
-            websocket.send_json(
-                {
-                    "event": "start_chat",
-                    "payload": {"chat_id": "test-123"},
-                }
-            )
-
-            # Should receive error
-            response = websocket.receive_json()
-            assert response["event"] == "error"
-            assert "message" in response["payload"]["message"].lower()
+        # Send start_chat without message
+        ws.send_json(
+            {
+                "event": "start_chat",
+                "payload": {"chat_id": "test-123"},
+            }
+        )
+
+        # Should receive error
+        response = ws.receive_json()
+        assert response["event"] == "error"
+        assert "message" in response["payload"]["message"].lower()
+
+
+class TestSharedTestClient:
+    """Tests for the session-scoped test_client fixture."""
+
+    def test_health_check(self, test_client):
+        """Test the shared client serves REST requests."""
+        response = test_client.get("/health")
+        assert response.status_code == 200
+
+    def test_websocket_ping_pong(self, test_client):
+        """Test the shared client serves WebSocket connections."""
+        with test_client.websocket_connect("/ws") as websocket:
+            websocket.send_text(_PING_FRAME)
+            assert websocket.receive_json()["event"] == "pong"
@@ -15,31 +15,49 @@ from reasoning_engine_pro.core.schemas.block_templates import (
 from reasoning_engine_pro.core.schemas.workflow import Block, Input
 
 
+def _input_values(block: Block) -> dict[str, str | None]:
+    """Map input names to static values so assertions avoid repeated scans."""
+    return {i.Name: i.StaticValue for i in block.Inputs}
+
+
+# Template blocks are built once per module; tests only read them.
+@pytest.fixture(scope="module")
+def ai_block() -> Block:
+    return AI_BLOCK_TEMPLATE.create_block("B002")
+
+
+@pytest.fixture(scope="module")
+def manual_block() -> Block:
+    return MANUAL_BLOCK_TEMPLATE.create_block("B003")
+
+
+@pytest.fixture(scope="module")
+def task_block() -> Block:
+    return TASK_BLOCK_TEMPLATE.create_block("B004")
+
+
 class TestAIBlockTemplate:
     """Tests for the AskWilfred AI block template."""
 
     def test_action_code(self):
         assert AI_BLOCK_TEMPLATE.ActionCode == "AskWilfred"
 
-    def test_creates_valid_block(self):
-        block = AI_BLOCK_TEMPLATE.create_block("B002")
-        assert isinstance(block, Block)
-        assert block.BlockId == "B002"
-        assert block.ActionCode == "AskWilfred"
-        assert block.Name == "Ask Wilfred"
-
-    def test_has_three_inputs(self):
-        block = AI_BLOCK_TEMPLATE.create_block("B002")
-        assert len(block.Inputs) == 3
-        input_names = [i.Name for i in block.Inputs]
+    def test_creates_valid_block(self, ai_block):
+        assert isinstance(ai_block, Block)
+        assert ai_block.BlockId == "B002"
+        assert ai_block.ActionCode == "AskWilfred"
+        assert ai_block.Name == "Ask Wilfred"
+
+    def test_has_three_inputs(self, ai_block):
+        assert len(ai_block.Inputs) == 3
+        input_names = [i.Name for i in ai_block.Inputs]
         assert "Prompt" in input_names
         assert "Attachment" in input_names
         assert "Output Format" in input_names
 
-    def test_has_one_output(self):
-        block = AI_BLOCK_TEMPLATE.create_block("B002")
-        assert len(block.Outputs) == 1
-        assert block.Outputs[0].Name == "Output"
+    def test_has_one_output(self, ai_block):
+        assert len(ai_block.Outputs) == 1
+        assert ai_block.Outputs[0].Name == "Output"
 
     def test_output_variable_name_uses_block_id(self):
         block = AI_BLOCK_TEMPLATE.create_block("B005")
@@ -52,31 +70,26 @@ class TestManualBlockTemplate:
     def test_action_code(self):
         assert MANUAL_BLOCK_TEMPLATE.ActionCode == "HumanDependent"
 
-    def test_creates_valid_block(self):
-        block = MANUAL_BLOCK_TEMPLATE.create_block("B003")
-        assert block.ActionCode == "HumanDependent"
-        assert block.Name == "Human Dependable Manual Task"
+    def test_creates_valid_block(self, manual_block):
+        assert manual_block.ActionCode == "HumanDependent"
+        assert manual_block.Name == "Human Dependable Manual Task"
 
-    def test_has_correct_inputs(self):
-        block = MANUAL_BLOCK_TEMPLATE.create_block("B003")
-        input_names = [i.Name for i in block.Inputs]
+    def test_has_correct_inputs(self, manual_block):
+        input_names = [i.Name for i in manual_block.Inputs]
         assert "Task Recipients" in input_names
         assert "Task" in input_names
         assert "Attachment" in input_names
 
-    def test_task_recipients_default(self):
-        block = MANUAL_BLOCK_TEMPLATE.create_block("B003")
-        recipients = next(i for i in block.Inputs if i.Name == "Task Recipients")
-        assert recipients.StaticValue == "<user>"
+    def test_task_recipients_default(self, manual_block):
+        assert _input_values(manual_block)["Task Recipients"] == "<user>"
 
 
 class TestTaskBlockTemplate:
     """Tests for the generic task block template."""
 
-    def test_creates_valid_block(self):
-        block = TASK_BLOCK_TEMPLATE.create_block("B004")
-        assert block.BlockId == "B004"
-        assert isinstance(block, Block)
+    def test_creates_valid_block(self, task_block):
+        assert task_block.BlockId == "B004"
+        assert isinstance(task_block, Block)
 
     def test_name_override(self):
         block = TASK_BLOCK_TEMPLATE.create_block("B004", Name="Custom Name")
@@ -108,65 +121,62 @@ class TestGetTemplateForAction:
         assert get_template_for_action("SendEmail") is None
 
 
+def _make_discovery_block(**input_overrides: str) -> Block:
+    defaults = {
+        "Should use client utility": "null",
+        "Application": "",
+        "Start Date": "null",
+        "End Date": "null",
+        "Timezone": "",
+        "Business Process": "Hire an Employee",
+    }
+    defaults.update(input_overrides)
+    return Block(
+        BlockId="B002",
+        Name="Run Discovery",
+        ActionCode="CreateDiscoverySnapshot",
+        Inputs=[Input(Name=k, StaticValue=v) for k, v in defaults.items()],
+        Outputs=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def discovery_defaults() -> dict[str, str | None]:
+    """Apply discovery defaults once and map each input name to its value."""
+    result = DiscoveryBlockProcessor.apply_defaults(_make_discovery_block())
+    return _input_values(result)
+
+
 class TestDiscoveryBlockProcessor:
     """Tests for CreateDiscoverySnapshot default filling."""
 
-    def _make_discovery_block(self, **input_overrides: str) -> Block:
-        defaults = {
-            "Should use client utility": "null",
-            "Application": "",
-            "Start Date": "null",
-            "End Date": "null",
-            "Timezone": "",
-            "Business Process": "Hire an Employee",
-        }
-        defaults.update(input_overrides)
-        return Block(
-            BlockId="B002",
-            Name="Run Discovery",
-            ActionCode="CreateDiscoverySnapshot",
-            Inputs=[Input(Name=k, StaticValue=v) for k, v in defaults.items()],
-            Outputs=[],
+    @pytest.mark.parametrize("field", ["Start Date", "End Date"])
+    def test_fills_empty_dates(self, discovery_defaults, field):
+        value = discovery_defaults[field]
+        assert value is not None
+        assert "11:59:59 PM" in value
+
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("Application", "OracleFusion"),
+            ("Timezone", "UTC"),
+            ("Should use client utility", "False"),
+            ("Business Process", "Hire an Employee"),
+        ],
+    )
+    def test_default_field(self, discovery_defaults, field, expected):
+        assert discovery_defaults[field] == expected
+
+    def test_dates_use_reference_time(self):
+        result = DiscoveryBlockProcessor.apply_defaults(
+            _make_discovery_block(), now=datetime(2025, 1, 31, 9, 30)
         )
-
-    def test_fills_empty_dates(self):
-        block = self._make_discovery_block()
-        result = DiscoveryBlockProcessor.apply_defaults(block)
-        start = next(i for i in result.Inputs if i.Name == "Start Date")
-        end = next(i for i in result.Inputs if i.Name == "End Date")
-        assert start.StaticValue is not None
-        assert "11:59:59 PM" in start.StaticValue
-        assert end.StaticValue is not None
-        assert "11:59:59 PM" in end.StaticValue
+        values = _input_values(result)
+        assert values["Start Date"] == "1/1/2025 11:59:59 PM"
+        assert values["End Date"] == "1/31/2025 11:59:59 PM"
 
     def test_preserves_existing_dates(self):
-        block = self._make_discovery_block(**{"Start Date": "1/1/2025 11:59:59 PM"})
-        result = DiscoveryBlockProcessor.apply_defaults(block)
-        start = next(i for i in result.Inputs if i.Name == "Start Date")
-        assert start.StaticValue == "1/1/2025 11:59:59 PM"
-
-    def test_sets_application(self):
-        block = self._make_discovery_block()
-        result = DiscoveryBlockProcessor.apply_defaults(block)
-        app = next(i for i in result.Inputs if i.Name == "Application")
-        assert app.StaticValue == "OracleFusion"
-
-    def test_sets_timezone(self):
-        block = self._make_discovery_block()
-        result = DiscoveryBlockProcessor.apply_defaults(block)
-        tz = next(i for i in result.Inputs if i.Name == "Timezone")
-        assert tz.StaticValue == "UTC"
-
-    def test_sets_client_utility_false(self):
-        block = self._make_discovery_block()
-        result = DiscoveryBlockProcessor.apply_defaults(block)
-        util = next(
-            i for i in result.Inputs if i.Name == "Should use client utility"
-        )
-        assert util.StaticValue == "False"
-
-    def test_preserves_business_process(self):
-        block = self._make_discovery_block()
+        block = _make_discovery_block(**{"Start Date": "1/1/2025 11:59:59 PM"})
         result = DiscoveryBlockProcessor.apply_defaults(block)
-        bp = next(i for i in result.Inputs if i.Name == "Business Process")
-        assert bp.StaticValue == "Hire an Employee"
+        assert _input_values(result)["Start Date"] == "1/1/2025 11:59:59 PM"
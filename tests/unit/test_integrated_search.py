@@ -4,12 +4,15 @@ from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from reasoning_engine_pro.config import Settings
 from reasoning_engine_pro.core.exceptions import ToolExecutionError
 from reasoning_engine_pro.core.schemas.tools import TaskBlockSearchResult, WebSearchResult
+from reasoning_engine_pro.services.search.factory import SearchServiceFactory
 from reasoning_engine_pro.services.search.integrated.client import IntegratedSearchClient
 from reasoning_engine_pro.services.search.integrated.response_parser import (
+    make_task_block_parser,
     parse_task_block_search_results,
     parse_web_search_results,
 )
@@ -19,10 +22,47 @@ from reasoning_engine_pro.services.search.integrated.task_block import (
 from reasoning_engine_pro.services.search.integrated.web_search import (
     IntegratedWebSearchService,
 )
+from reasoning_engine_pro.services.search.task_block import TaskBlockSearchService
+from reasoning_engine_pro.services.search.web_search import WebSearchService
+
+
+_BASE_SETTINGS = Settings(
+    planner_llm_provider="vllm",
+    planner_llm_base_url="http://localhost:8000/v1",
+    planner_llm_api_key="test",
+    planner_llm_model_name="test-model",
+    redis_url="",
+)
+
+
+def _make_settings(**overrides) -> Settings:
+    """Copy the validated base settings; overrides are applied unvalidated."""
+    return _BASE_SETTINGS.model_copy(update=overrides)
 
 
 # --- Response Parser Tests ---
 
+# Multi-result payloads are built once at import.
+_TEN_RESULT_CONTENT = (
+    "<web_search>\nresults=["
+    + ", ".join(
+        f"SearchResult(title='Result {i}', url='https://example.com/{i}', "
+        f"snippet='S{i}', content='C{i}')"
+        for i in range(10)
+    )
+    + "]\n</web_search>"
+)
+_TWO_ELASTIC_RESULT_CONTENT = (
+    "<plain_elastic_task_block_search>\n"
+    "results=["
+    "TaskSearchResult(id='a', name='Block A', action_code='ActionA', "
+    "description='Desc A', score=10.0, similarity=1.0), "
+    "TaskSearchResult(id='b', name='Block B', action_code='ActionB', "
+    "description='Desc B', score=8.0, similarity=0.8)"
+    "]\n"
+    "</plain_elastic_task_block_search>"
+)
+
 
 class TestParseWebSearchResults:
     """Tests for web search response parser."""
@@ -63,16 +103,16 @@ class TestParseWebSearchResults:
         results = parse_web_search_results(response)
         assert results == []
 
+    def test_empty_on_unclosed_section(self):
+        """Test returns empty when the opening tag has no closing tag."""
+        response = {"content": "<web_search>\nresults=[]"}
+        assert parse_web_search_results(response) == []
+
     def test_max_results_limit(self):
         """Test that max_results is respected."""
-        items = ", ".join(
-            f"SearchResult(title='Result {i}', url='https://example.com/{i}', snippet='S{i}', content='C{i}')"
-            for i in range(10)
+        results = parse_web_search_results(
+            {"content": _TEN_RESULT_CONTENT}, max_results=3
         )
-        response = {
-            "content": f"<web_search>\nresults=[{items}]\n</web_search>",
-        }
-        results = parse_web_search_results(response, max_results=3)
         assert len(results) == 3
 
     def test_handles_escaped_quotes(self):
@@ -89,6 +129,19 @@ class TestParseWebSearchResults:
         assert len(results) == 1
         assert results[0].title == "It's a test"
 
+    def test_field_names_inside_values_are_ignored(self):
+        """Test that text inside a quoted value is not read as another field."""
+        response = {
+            "content": (
+                "<web_search>\n"
+                "results=[SearchResult(content=\"see title='Fake'\", "
+                "title='Real', url='https://example.com', snippet='S')]\n"
+                "</web_search>"
+            ),
+        }
+        results = parse_web_search_results(response)
+        assert results[0].title == "Real"
+
 
 class TestParseTaskBlockSearchResults:
     """Tests for task block search response parser."""
@@ -112,6 +165,10 @@ class TestParseTaskBlockSearchResults:
         assert results[0].name == "Export Config"
         assert results[0].action_code == "ExportConfigurations"
         assert results[0].relevance_score == 0.95
+        assert results[0].inputs == []
+        assert results[0] == TaskBlockSearchResult.model_validate(
+            results[0].model_dump()
+        )
 
     def test_llm_text_summary(self):
         """Test parsing LLM task block results (plain text summary)."""
@@ -136,45 +193,53 @@ class TestParseTaskBlockSearchResults:
 
     def test_multiple_elastic_results(self):
         """Test parsing multiple elastic results."""
-        response = {
-            "content": (
-                "<plain_elastic_task_block_search>\n"
-                "results=["
-                "TaskSearchResult(id='a', name='Block A', action_code='ActionA', "
-                "description='Desc A', score=10.0, similarity=1.0), "
-                "TaskSearchResult(id='b', name='Block B', action_code='ActionB', "
-                "description='Desc B', score=8.0, similarity=0.8)"
-                "]\n"
-                "</plain_elastic_task_block_search>"
-            ),
-        }
-        results = parse_task_block_search_results(response, search_type="elastic")
+        results = parse_task_block_search_results(
+            {"content": _TWO_ELASTIC_RESULT_CONTENT}, search_type="elastic"
+        )
         assert len(results) == 2
         assert results[0].block_id == "a"
         assert results[1].block_id == "b"
 
+    def test_prebuilt_parser_matches_wrapper(self):
+        """Test a parser built once per search type gives the wrapper's results."""
+        parse_elastic = make_task_block_parser("elastic")
+        response = {"content": _TWO_ELASTIC_RESULT_CONTENT}
+        assert parse_elastic(response, 1) == parse_task_block_search_results(
+            response, search_type="elastic", max_results=1
+        )
+
 
 # --- IntegratedSearchClient Tests ---
 
 
+def _make_search_client() -> IntegratedSearchClient:
+    return IntegratedSearchClient(
+        api_url="http://test-host:443/integrated-search",
+        api_key="pk_test_key",
+        timeout=10.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_search_client() -> IntegratedSearchClient:
+    return _make_search_client()
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestIntegratedSearchClient:
     """Tests for the shared HTTP client."""
 
-    @pytest.fixture
-    def client(self):
-        return IntegratedSearchClient(
-            api_url="http://test-host:443/integrated-search",
-            api_key="pk_test_key",
-            timeout=10.0,
-        )
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def client(self, shared_search_client):
+        """Reuse the module client; its per-test httpx client is closed afterwards."""
+        yield shared_search_client
+        await shared_search_client.close()
 
-    @pytest.mark.asyncio
     async def test_search_success(self, client):
         """Test successful search call."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"query": "test", "content": "", "sources": []}'
-        mock_response.json.return_value = {"query": "test", "content": "", "sources": []}
+        mock_response.content = b'{"query": "test", "content": "", "sources": []}'
         mock_response.raise_for_status = MagicMock()
 
         mock_http_client = AsyncMock()
@@ -189,15 +254,19 @@ class TestIntegratedSearchClient:
         )
         assert result == {"query": "test", "content": "", "sources": []}
 
-    @pytest.mark.asyncio
     async def test_auth_header_format(self, client):
         """Test that auth header uses raw key (not Bearer)."""
         http_client = await client._get_client()
         assert http_client.headers["Authorization"] == "pk_test_key"
 
-    @pytest.mark.asyncio
-    async def test_close(self, client):
+    async def test_http_client_reused_across_calls(self, client):
+        """Test that one pooled httpx client serves every request."""
+        first = await client._get_client()
+        assert await client._get_client() is first
+
+    async def test_close(self):
         """Test client cleanup."""
+        client = _make_search_client()
         mock_http_client = AsyncMock()
         client._client = mock_http_client
         await client.close()
@@ -208,13 +277,63 @@ class TestIntegratedSearchClient:
 # --- IntegratedWebSearchService Tests ---
 
 
+# Canned endpoint responses; the services only read them.
+_WEB_SEARCH_RESPONSE = {
+    "content": (
+        "<web_search>\nresults=["
+        "SearchResult(title='Test', url='https://test.com', "
+        "snippet='A test result', content='Full content')"
+        "]\n</web_search>"
+    ),
+}
+
+_LLM_TASK_BLOCK_RESPONSE = {
+    "content": (
+        "<llm_task_block_search>\n"
+        "Export Configurations is the relevant task.\n"
+        "</llm_task_block_search>"
+    ),
+}
+
+_ELASTIC_TASK_BLOCK_RESPONSE = {
+    "content": (
+        "<plain_elastic_task_block_search>\n"
+        "results=["
+        "TaskSearchResult(id='abc', name='Import Data', "
+        "action_code='ImportData', description='Imports data', "
+        "score=8.0, similarity=0.85)"
+        "]\n"
+        "</plain_elastic_task_block_search>"
+    ),
+}
+
+
+class _DummySearchClient:
+    """Hand-written IntegratedSearchClient stand-in; avoids per-test spec introspection."""
+
+    def __init__(self) -> None:
+        self.search = AsyncMock()
+        self.close = AsyncMock()
+
+
+def _always_raise(exc: Exception):
+    """Build a plain coroutine function that raises exc; no mock bookkeeping."""
+
+    async def _raise(*args, **kwargs):
+        raise exc
+
+    return _raise
+
+
+@pytest.fixture
+def mock_client() -> _DummySearchClient:
+    return _DummySearchClient()
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestIntegratedWebSearchService:
     """Tests for integrated web search service."""
 
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock(spec=IntegratedSearchClient)
-
     @pytest.fixture
     def service(self, mock_client):
         return IntegratedWebSearchService(
@@ -223,17 +342,9 @@ class TestIntegratedWebSearchService:
             model_type="big",
         )
 
-    @pytest.mark.asyncio
     async def test_search_builds_correct_request(self, service, mock_client):
         """Test that search builds the correct request body."""
-        mock_client.search.return_value = {
-            "content": (
-                "<web_search>\nresults=["
-                "SearchResult(title='Test', url='https://test.com', "
-                "snippet='A test result', content='Full content')"
-                "]\n</web_search>"
-            ),
-        }
+        mock_client.search.return_value = _WEB_SEARCH_RESPONSE
 
         results = await service.search("test query")
 
@@ -247,29 +358,38 @@ class TestIntegratedWebSearchService:
         assert len(results) == 1
         assert isinstance(results[0], WebSearchResult)
 
-    @pytest.mark.asyncio
+    async def test_request_body_built_per_query(self, service, mock_client):
+        """Test each call gets its own query without mutating shared params."""
+        mock_client.search.return_value = _WEB_SEARCH_RESPONSE
+
+        await service.search("first")
+        first_body = mock_client.search.call_args[0][0]
+        await service.search("second")
+        second_body = mock_client.search.call_args[0][0]
+
+        assert first_body["web_search_params"]["query"] == "first"
+        assert second_body["web_search_params"]["query"] == "second"
+
     async def test_search_timeout_raises_tool_error(self, service, mock_client):
         """Test that timeouts produce ToolExecutionError."""
-        mock_client.search.side_effect = httpx.ReadTimeout("timeout")
+        mock_client.search = _always_raise(httpx.ReadTimeout("timeout"))
 
         with pytest.raises(ToolExecutionError) as exc_info:
             await service.search("test query")
         assert exc_info.value.tool_name == "web_search"
 
-    @pytest.mark.asyncio
     async def test_search_http_error_raises_tool_error(self, service, mock_client):
         """Test that HTTP errors produce ToolExecutionError."""
         response = MagicMock()
         response.status_code = 500
-        mock_client.search.side_effect = httpx.HTTPStatusError(
-            "Server Error", request=MagicMock(), response=response
+        mock_client.search = _always_raise(
+            httpx.HTTPStatusError("Server Error", request=MagicMock(), response=response)
         )
 
         with pytest.raises(ToolExecutionError) as exc_info:
             await service.search("test query")
         assert exc_info.value.tool_name == "web_search"
 
-    @pytest.mark.asyncio
     async def test_close_is_noop(self, service):
         """Test that close does not close the shared client."""
         await service.close()  # Should not raise
@@ -278,13 +398,10 @@ class TestIntegratedWebSearchService:
 # --- IntegratedTaskBlockSearchService Tests ---
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestIntegratedTaskBlockSearchService:
     """Tests for integrated task block search service."""
 
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock(spec=IntegratedSearchClient)
-
     @pytest.fixture
     def llm_service(self, mock_client):
         return IntegratedTaskBlockSearchService(
@@ -301,16 +418,9 @@ class TestIntegratedTaskBlockSearchService:
             elastic_size=5,
         )
 
-    @pytest.mark.asyncio
     async def test_llm_search_builds_correct_request(self, llm_service, mock_client):
         """Test LLM search type sets correct flags."""
-        mock_client.search.return_value = {
-            "content": (
-                "<llm_task_block_search>\n"
-                "Export Configurations is the relevant task.\n"
-                "</llm_task_block_search>"
-            ),
-        }
+        mock_client.search.return_value = _LLM_TASK_BLOCK_RESPONSE
 
         results = await llm_service.search("export config")
 
@@ -323,20 +433,9 @@ class TestIntegratedTaskBlockSearchService:
         assert len(results) == 1
         assert isinstance(results[0], TaskBlockSearchResult)
 
-    @pytest.mark.asyncio
     async def test_elastic_search_builds_correct_request(self, elastic_service, mock_client):
         """Test elastic search type sets correct flags."""
-        mock_client.search.return_value = {
-            "content": (
-                "<plain_elastic_task_block_search>\n"
-                "results=["
-                "TaskSearchResult(id='abc', name='Import Data', "
-                "action_code='ImportData', description='Imports data', "
-                "score=8.0, similarity=0.85)"
-                "]\n"
-                "</plain_elastic_task_block_search>"
-            ),
-        }
+        mock_client.search.return_value = _ELASTIC_TASK_BLOCK_RESPONSE
 
         results = await elastic_service.search("import data")
 
@@ -347,16 +446,14 @@ class TestIntegratedTaskBlockSearchService:
         assert call_args["plain_elastic_task_block_search_params"]["size"] == 5
         assert len(results) == 1
 
-    @pytest.mark.asyncio
     async def test_timeout_raises_tool_error(self, llm_service, mock_client):
         """Test that timeouts produce ToolExecutionError."""
-        mock_client.search.side_effect = httpx.ReadTimeout("timeout")
+        mock_client.search = _always_raise(httpx.ReadTimeout("timeout"))
 
         with pytest.raises(ToolExecutionError) as exc_info:
             await llm_service.search("test")
         assert exc_info.value.tool_name == "task_block_search"
 
-    @pytest.mark.asyncio
     async def test_get_block_details_returns_none(self, llm_service):
         """Test get_block_details returns None (unsupported)."""
         result = await llm_service.get_block_details("some-block")
@@ -366,80 +463,81 @@ class TestIntegratedTaskBlockSearchService:
 # --- Factory Routing Tests ---
 
 
-class TestSearchServiceFactoryRouting:
-    """Tests for factory backend routing."""
+@pytest.fixture(scope="module")
+def legacy_settings() -> Settings:
+    return _make_settings(
+        web_search_backend="perplexity",
+        task_block_search_backend="legacy",
+    )
 
-    def _make_settings(self, **overrides) -> Settings:
-        base = {
-            "planner_llm_provider": "vllm",
-            "planner_llm_base_url": "http://localhost:8000/v1",
-            "planner_llm_api_key": "test",
-            "planner_llm_model_name": "test-model",
-            "redis_url": "",
-        }
-        base.update(overrides)
-        return Settings(**base)
 
-    def test_web_search_perplexity_backend(self):
-        """Test factory returns WebSearchService for perplexity backend."""
-        from reasoning_engine_pro.services.search.factory import SearchServiceFactory
-        from reasoning_engine_pro.services.search.web_search import WebSearchService
+@pytest.fixture(scope="module")
+def integrated_settings() -> Settings:
+    return _make_settings(
+        web_search_backend="integrated",
+        task_block_search_backend="integrated",
+        integrated_search_url="http://test:443/search",
+        integrated_search_api_key="pk_test",
+    )
 
-        SearchServiceFactory.reset()
-        settings = self._make_settings(web_search_backend="perplexity")
-        service = SearchServiceFactory.create_web_search(settings)
-        assert isinstance(service, WebSearchService)
 
-    def test_web_search_integrated_backend(self):
-        """Test factory returns IntegratedWebSearchService for integrated backend."""
-        from reasoning_engine_pro.services.search.factory import SearchServiceFactory
+class TestSearchServiceFactoryRouting:
+    """Tests for factory backend routing."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_factory(self):
         SearchServiceFactory.reset()
-        settings = self._make_settings(
-            web_search_backend="integrated",
-            integrated_search_url="http://test:443/search",
-            integrated_search_api_key="pk_test",
-        )
-        service = SearchServiceFactory.create_web_search(settings)
-        assert isinstance(service, IntegratedWebSearchService)
-        SearchServiceFactory.reset()
-
-    def test_task_block_legacy_backend(self):
-        """Test factory returns TaskBlockSearchService for legacy backend."""
-        from reasoning_engine_pro.services.search.factory import SearchServiceFactory
-        from reasoning_engine_pro.services.search.task_block import TaskBlockSearchService
-
+        yield
         SearchServiceFactory.reset()
-        settings = self._make_settings(task_block_search_backend="legacy")
-        service = SearchServiceFactory.create_task_block_search(settings)
-        assert isinstance(service, TaskBlockSearchService)
-
-    def test_task_block_integrated_backend(self):
-        """Test factory returns IntegratedTaskBlockSearchService for integrated backend."""
-        from reasoning_engine_pro.services.search.factory import SearchServiceFactory
 
-        SearchServiceFactory.reset()
-        settings = self._make_settings(
-            task_block_search_backend="integrated",
-            integrated_search_url="http://test:443/search",
-            integrated_search_api_key="pk_test",
-        )
+    @pytest.mark.parametrize(
+        ("settings_fixture", "expected_cls"),
+        [
+            ("legacy_settings", WebSearchService),
+            ("integrated_settings", IntegratedWebSearchService),
+        ],
+    )
+    def test_web_search_routing(self, request, settings_fixture, expected_cls):
+        """Test factory returns the web search service for the configured backend."""
+        settings = request.getfixturevalue(settings_fixture)
+        service = SearchServiceFactory.create_web_search(settings)
+        assert isinstance(service, expected_cls)
+
+    @pytest.mark.parametrize(
+        ("settings_fixture", "expected_cls"),
+        [
+            ("legacy_settings", TaskBlockSearchService),
+            ("integrated_settings", IntegratedTaskBlockSearchService),
+        ],
+    )
+    def test_task_block_routing(self, request, settings_fixture, expected_cls):
+        """Test factory returns the task block service for the configured backend."""
+        settings = request.getfixturevalue(settings_fixture)
         service = SearchServiceFactory.create_task_block_search(settings)
-        assert isinstance(service, IntegratedTaskBlockSearchService)
-        SearchServiceFactory.reset()
+        assert isinstance(service, expected_cls)
 
-    def test_shared_client_reused(self):
+    def test_shared_client_reused(self, integrated_settings):
         """Test that both integrated services share the same client."""
-        from reasoning_engine_pro.services.search.factory import SearchServiceFactory
+        web_service = SearchServiceFactory.create_web_search(integrated_settings)
+        tb_service = SearchServiceFactory.create_task_block_search(integrated_settings)
+        assert web_service._client is tb_service._client
 
-        SearchServiceFactory.reset()
-        settings = self._make_settings(
+    def test_services_memoized_on_settings(self, integrated_settings):
+        """Test equal settings reuse a service and different settings do not."""
+        service = SearchServiceFactory.create_web_search(integrated_settings)
+        assert SearchServiceFactory.create_web_search(integrated_settings) is service
+
+        other = _make_settings(
             web_search_backend="integrated",
-            task_block_search_backend="integrated",
-            integrated_search_url="http://test:443/search",
+            integrated_search_url="http://other:443/search",
             integrated_search_api_key="pk_test",
         )
-        web_service = SearchServiceFactory.create_web_search(settings)
-        tb_service = SearchServiceFactory.create_task_block_search(settings)
-        assert web_service._client is tb_service._client
-        SearchServiceFactory.reset()
+        other_service = SearchServiceFactory.create_web_search(other)
+        assert other_service is not service
+        assert other_service._client is not service._client
+
+    async def test_close_drops_cached_services(self, integrated_settings):
+        """Test closing the integrated clients also drops cached services."""
+        service = SearchServiceFactory.create_web_search(integrated_settings)
+        await SearchServiceFactory.close_integrated_client()
+        assert SearchServiceFactory.create_web_search(integrated_settings) is not service
@@ -5,8 +5,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from reasoning_engine_pro.core.enums import MessageRole
-from reasoning_engine_pro.core.schemas.messages import ChatMessage
+from reasoning_engine_pro.core.schemas.messages import ChatMessage, ToolCall
 from reasoning_engine_pro.llm.factory import LLMProviderFactory
+from reasoning_engine_pro.llm.providers import base
 from reasoning_engine_pro.llm.providers.openai import OpenAIProvider
 from reasoning_engine_pro.llm.providers.vllm import VLLMProvider
 
@@ -84,6 +85,69 @@ class TestVLLMProvider:
         assert result[1]["role"] == "assistant"
         assert result[1]["content"] == "Hi there"
 
+    def test_messages_to_openai_tool_messages(self, provider):
+        """Test tool call and tool result messages use the OpenAI wire shape."""
+        messages = [
+            ChatMessage(
+                role=MessageRole.ASSISTANT,
+                tool_calls=[
+                    ToolCall(id="call-1", name="web_search", arguments={"q": "x"})
+                ],
+            ),
+            ChatMessage(
+                role=MessageRole.TOOL,
+                content="[]",
+                tool_call_id="call-1",
+                name="web_search",
+            ),
+        ]
+
+        result = provider._messages_to_openai(messages)
+
+        assert result == [
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "id": "call-1",
+                        "type": "function",
+                        "function": {"name": "web_search", "arguments": '{"q": "x"}'},
+                    }
+                ],
+            },
+            {
+                "role": "tool",
+                "content": "[]",
+                "tool_call_id": "call-1",
+                "name": "web_search",
+            },
+        ]
+
+    def test_messages_to_openai_reuses_history_prefix(self, provider):
+        """Test a message re-sent on a later call is converted only once."""
+        first = ChatMessage(role=MessageRole.USER, content="Hello")
+        history = [first]
+        converted = provider._messages_to_openai(history)[0]
+
+        history.append(ChatMessage(role=MessageRole.ASSISTANT, content="Hi"))
+        result = provider._messages_to_openai(history)
+
+        assert result[0] is converted
+        assert result[1] == {"role": "assistant", "content": "Hi"}
+
+    def test_message_cache_evicts_least_recently_used(self, provider, monkeypatch):
+        """Test a cache hit refreshes the entry so it outlives older ones."""
+        monkeypatch.setattr(base, "_OPENAI_MESSAGE_CACHE_SIZE", 2)
+        a, b, c = (ChatMessage(role=MessageRole.USER, content=t) for t in "abc")
+
+        converted_a = provider._messages_to_openai([a, b])[0]
+        provider._messages_to_openai([a])  # Refresh a; b is now oldest
+        provider._messages_to_openai([c])
+
+        cached = [m for m, _ in provider._openai_message_cache.values()]
+        assert cached == [a, c]
+        assert provider._messages_to_openai([a])[0] is converted_a
+
 
 class TestOpenAIProvider:
     """Tests for OpenAIProvider."""
@@ -1,33 +1,38 @@
 """Tests for ConversationOrchestrator."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 from reasoning_engine_pro.agents.few_shot import FewShotRetriever
 from reasoning_engine_pro.agents.job_name import JobNameGenerator
 from reasoning_engine_pro.agents.orchestrator import ConversationOrchestrator
-from reasoning_engine_pro.agents.planner import PlannerAgent
-from reasoning_engine_pro.agents.validator import WorkflowValidator
 from reasoning_engine_pro.core.enums import ConversationStatus, MessageRole
 from reasoning_engine_pro.core.schemas.messages import ChatMessage, ConversationState
 from reasoning_engine_pro.services.storage.memory import InMemoryStorage
 
 
+class _FakePlanner:
+    """PlannerAgent stand-in exposing only plan(); avoids spec introspection."""
+
+    def __init__(self) -> None:
+        self.plan = AsyncMock(return_value=("Test response", None))
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestConversationOrchestrator:
     """Tests for ConversationOrchestrator."""
 
     @pytest.fixture
     def mock_planner(self):
         """Create mock planner."""
-        planner = AsyncMock(spec=PlannerAgent)
-        planner.plan = AsyncMock(return_value=("Test response", None))
-        return planner
+        return _FakePlanner()
 
     @pytest.fixture
     def mock_validator(self):
-        """Create mock validator."""
-        return MagicMock(spec=WorkflowValidator)
+        """Create a no-op validator (these tests never reach validation)."""
+        return SimpleNamespace(validate=AsyncMock(return_value=None))
 
     @pytest.fixture
     def mock_event_emitter(self):
@@ -56,7 +61,6 @@ class TestConversationOrchestrator:
             event_emitter=mock_event_emitter,
         )
 
-    @pytest.mark.asyncio
     async def test_start_conversation(
         self, orchestrator, memory_storage, mock_event_emitter
     ):
@@ -76,7 +80,6 @@ class TestConversationOrchestrator:
         assert len(history) >= 1
         assert history[0].content == "Create a workflow"
 
-    @pytest.mark.asyncio
     async def test_get_conversation_state(self, orchestrator, memory_storage):
         """Test getting conversation state."""
         # Setup state
@@ -92,7 +95,6 @@ class TestConversationOrchestrator:
         assert result is not None
         assert result.conversation_id == "test-123"
 
-    @pytest.mark.asyncio
     async def test_get_conversation_history(self, orchestrator, memory_storage):
         """Test getting conversation history."""
         # Setup messages
@@ -105,7 +107,18 @@ class TestConversationOrchestrator:
         assert len(history) == 1
         assert history[0].content == "Test message"
 
-    @pytest.mark.asyncio
+    async def test_history_copy_does_not_alias_storage(self, memory_storage):
+        """Test get_history returns a copy of the stored history."""
+        msg = ChatMessage(role=MessageRole.USER, content="Test message")
+        await memory_storage.save_message("test-123", msg)
+
+        history = await memory_storage.get_history("test-123")
+        history[0] = ChatMessage(role=MessageRole.USER, content="Edited")
+
+        stored = await memory_storage.get_history("test-123")
+        assert stored[0] is msg
+        assert stored is not history
+
     async def test_end_conversation(self, orchestrator, memory_storage):
         """Test ending a conversation."""
         # Setup state
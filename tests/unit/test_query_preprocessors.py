@@ -1,7 +1,5 @@
 """Tests for query preprocessor implementations and factory."""
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from reasoning_engine_pro.agents.preprocessors.factory import QueryPreprocessorFactory
@@ -12,6 +10,7 @@ from reasoning_engine_pro.agents.preprocessors.passthrough import PassthroughPre
 from reasoning_engine_pro.agents.preprocessors.query_refinement import (
     QueryRefinementPreprocessor,
 )
+from reasoning_engine_pro.agents.prompts.domain_data import format_config_sequences
 from reasoning_engine_pro.config import Settings
 from reasoning_engine_pro.core.enums import MessageRole
 from reasoning_engine_pro.core.interfaces.query_preprocessor import IQueryPreprocessor
@@ -65,25 +64,18 @@ class TestQueryRefinementPreprocessor:
         assert "export blocks" in result
 
     @pytest.mark.asyncio
-    async def test_falls_back_on_llm_failure(self, preprocessor, mock_llm):
-        async def _generate(messages, **kwargs):
-            raise RuntimeError("LLM unavailable")
-
-        mock_llm.generate = _generate
-
+    async def test_falls_back_on_llm_failure(self, preprocessor, failing_llm_provider):
         result = await preprocessor.preprocess("Export config", [])
         assert result == "Export config"
 
     @pytest.mark.asyncio
-    async def test_emits_events(self, mock_llm):
-        emitter = AsyncMock()
-        emitter.emit = AsyncMock()
+    async def test_emits_events(self, mock_llm, mock_emitter):
         preprocessor = QueryRefinementPreprocessor(
-            llm_provider=mock_llm, event_emitter=emitter
+            llm_provider=mock_llm, event_emitter=mock_emitter
         )
 
         result = await preprocessor.preprocess("test query", [])
-        assert emitter.emit.call_count >= 2  # started + completed
+        assert len(mock_emitter.events) >= 2  # started + completed
 
 
 class TestInlineRefinementPreprocessor:
@@ -111,6 +103,10 @@ class TestInlineRefinementPreprocessor:
         result = await preprocessor.preprocess("test", [])
         assert "HCM" in result or "Financials" in result
 
+    def test_guidance_formatted_once(self, preprocessor):
+        assert preprocessor._guidance is preprocessor._guidance
+        assert format_config_sequences() is format_config_sequences()
+
 
 class TestQueryPreprocessorFactory:
     def test_disabled_returns_passthrough(self, test_settings):
@@ -1,7 +1,7 @@
 """Tests for ReferencingAgent."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -46,32 +46,50 @@ def _make_workflow(**overrides) -> Workflow:
     return Workflow(**defaults)
 
 
-def _make_history() -> list[ChatMessage]:
-    return [
-        ChatMessage(
-            role=MessageRole.USER,
-            content="Export HCM configuration for Benefits module",
-        ),
-        ChatMessage(
-            role=MessageRole.ASSISTANT,
-            content="I'll create a workflow to export HCM Benefits configuration.",
-        ),
-    ]
+def _fenced_json(data: dict) -> str:
+    """Wrap a workflow dict the way the LLM returns it."""
+    return f"```json\n{json.dumps(data)}\n```"
+
+
+def _assistant_reply(content: str) -> ChatMessage:
+    """Build the assistant message a stubbed LLM returns."""
+    return ChatMessage(role=MessageRole.ASSISTANT, content=content)
+
+
+def _generate_returning(message: ChatMessage):
+    """Build a generate() stub that always returns `message`."""
+
+    async def generate(*args, **kwargs) -> ChatMessage:
+        return message
+
+    return generate
+
+
+# LLM reply that echoes the unfilled workflow back; built once at import.
+# The agent only reads it, so tests can share the instance.
+_UNFILLED_REPLY = _fenced_json(_make_workflow().model_dump())
+_UNFILLED_MESSAGE = _assistant_reply(_UNFILLED_REPLY)
+
+
+# The agent only reads history, so one list serves every test.
+_HISTORY = [
+    ChatMessage(
+        role=MessageRole.USER,
+        content="Export HCM configuration for Benefits module",
+    ),
+    ChatMessage(
+        role=MessageRole.ASSISTANT,
+        content="I'll create a workflow to export HCM Benefits configuration.",
+    ),
+]
 
 
 class TestReferencingAgent:
     """Tests for ReferencingAgent."""
 
     @pytest.fixture
-    def mock_llm(self):
-        llm = AsyncMock()
-        return llm
-
-    @pytest.fixture
-    def mock_emitter(self):
-        emitter = AsyncMock()
-        emitter.emit = AsyncMock()
-        return emitter
+    def mock_llm(self, mock_llm_provider):
+        return mock_llm_provider
 
     @pytest.fixture
     def agent(self, mock_llm, mock_emitter):
@@ -90,16 +108,13 @@ class TestReferencingAgent:
         filled["workflow_json"][1]["Inputs"][0]["StaticValue"] = "HCM"
         filled["workflow_json"][1]["Inputs"][1]["StaticValue"] = "Benefits"
 
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=f"```json\n{json.dumps(filled)}\n```",
-            )
+        mock_llm.generate = _generate_returning(
+            _assistant_reply(_fenced_json(filled))
         )
 
         result = await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
             conversation_id="conv-1",
         )
 
@@ -113,16 +128,13 @@ class TestReferencingAgent:
         """Returns original workflow when LLM response is unparseable."""
         workflow = _make_workflow()
 
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="I cannot parse this workflow correctly.",
-            )
+        mock_llm.generate = _generate_returning(
+            _assistant_reply("I cannot parse this workflow correctly.")
         )
 
         result = await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
             conversation_id="conv-1",
         )
 
@@ -130,15 +142,15 @@ class TestReferencingAgent:
         assert result is workflow
 
     @pytest.mark.asyncio
-    async def test_returns_original_on_llm_exception(self, agent, mock_llm):
+    async def test_returns_original_on_llm_exception(
+        self, agent, failing_llm_provider
+    ):
         """Returns original workflow when LLM raises an exception."""
         workflow = _make_workflow()
 
-        mock_llm.generate = AsyncMock(side_effect=RuntimeError("LLM down"))
-
         result = await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
             conversation_id="conv-1",
         )
 
@@ -150,24 +162,18 @@ class TestReferencingAgent:
     ):
         """Emits REFERENCING_STARTED event when conversation_id is provided."""
         workflow = _make_workflow()
-        filled = workflow.model_dump()
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=f"```json\n{json.dumps(filled)}\n```",
-            )
-        )
+        mock_llm.generate = _generate_returning(_UNFILLED_MESSAGE)
 
         await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
             conversation_id="conv-1",
         )
 
-        mock_emitter.emit.assert_called_once()
-        call_args = mock_emitter.emit.call_args
-        assert call_args[0][0] == EventType.REFERENCING_STARTED
-        assert call_args[0][1]["chat_id"] == "conv-1"
+        assert len(mock_emitter.events) == 1
+        event_type, payload = mock_emitter.events[0]
+        assert event_type == EventType.REFERENCING_STARTED
+        assert payload["chat_id"] == "conv-1"
 
     @pytest.mark.asyncio
     async def test_no_event_without_conversation_id(
@@ -175,41 +181,30 @@ class TestReferencingAgent:
     ):
         """Does not emit event when no conversation_id is provided."""
         workflow = _make_workflow()
-        filled = workflow.model_dump()
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=f"```json\n{json.dumps(filled)}\n```",
-            )
-        )
+        mock_llm.generate = _generate_returning(_UNFILLED_MESSAGE)
 
         await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
         )
 
-        mock_emitter.emit.assert_not_called()
+        assert mock_emitter.events == []
 
     @pytest.mark.asyncio
     async def test_builds_query_from_both_roles(self, agent, mock_llm):
         """User and assistant messages are included in query history."""
         workflow = _make_workflow()
-        filled = workflow.model_dump()
 
         captured_prompt = None
 
         async def capture_generate(messages, **kwargs):
             nonlocal captured_prompt
             captured_prompt = messages[0].content
-            return ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=f"```json\n{json.dumps(filled)}\n```",
-            )
+            return _UNFILLED_MESSAGE
 
         mock_llm.generate = capture_generate
 
-        history = _make_history()
-        await agent.run(workflow=workflow, history=history)
+        await agent.run(workflow=workflow, history=_HISTORY)
 
         assert captured_prompt is not None
         assert "User:" in captured_prompt
@@ -223,16 +218,13 @@ class TestReferencingAgent:
         filled = workflow.model_dump()
         filled["workflow_json"][1]["Inputs"][0]["StaticValue"] = "Filled"
 
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=json.dumps(filled),
-            )
+        mock_llm.generate = _generate_returning(
+            _assistant_reply(json.dumps(filled))
         )
 
         result = await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
         )
 
         assert result.workflow_json[1].Inputs[0].StaticValue == "Filled"
@@ -244,21 +236,15 @@ class TestReferencingAgentNoEmitter:
     @pytest.mark.asyncio
     async def test_works_without_emitter(self):
         """Agent works when no event emitter is provided."""
-        mock_llm = AsyncMock()
+        mock_llm = SimpleNamespace()
         agent = ReferencingAgent(llm_provider=mock_llm, event_emitter=None)
 
         workflow = _make_workflow()
-        filled = workflow.model_dump()
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content=f"```json\n{json.dumps(filled)}\n```",
-            )
-        )
+        mock_llm.generate = _generate_returning(_UNFILLED_MESSAGE)
 
         result = await agent.run(
             workflow=workflow,
-            history=_make_history(),
+            history=_HISTORY,
             conversation_id="conv-1",
         )
 
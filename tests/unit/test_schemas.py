@@ -17,29 +17,52 @@ from reasoning_engine_pro.core.schemas.workflow import (
     Output,
     Workflow,
 )
+from tests.fixtures.sample_workflows import SampleWorkflows
 
 
 class TestWorkflowSchemas:
     """Tests for workflow schemas."""
 
-    def test_input_with_static_value(self):
-        """Test Input with static value."""
-        inp = Input(Name="test", StaticValue="value")
-        assert inp.Name == "test"
-        assert inp.StaticValue == "value"
-        assert inp.ReferencedOutputVariableName is None
-
-    def test_input_with_reference(self):
-        """Test Input with output reference."""
-        inp = Input(Name="test", ReferencedOutputVariableName="op-B001-File")
-        assert inp.Name == "test"
-        assert inp.ReferencedOutputVariableName == "op-B001-File"
-
-    def test_output_creation(self):
-        """Test Output creation."""
-        out = Output(Name="Result", OutputVariableName="op-B001-Result")
-        assert out.Name == "Result"
-        assert out.OutputVariableName == "op-B001-Result"
+    @pytest.mark.parametrize(
+        ("model_cls", "kwargs", "expected"),
+        [
+            pytest.param(
+                Input,
+                {"Name": "test", "StaticValue": "value"},
+                {"Name": "test", "StaticValue": "value", "ReferencedOutputVariableName": None},
+                id="input_with_static_value",
+            ),
+            pytest.param(
+                Input,
+                {"Name": "test", "ReferencedOutputVariableName": "op-B001-File"},
+                {"Name": "test", "ReferencedOutputVariableName": "op-B001-File"},
+                id="input_with_reference",
+            ),
+            pytest.param(
+                Output,
+                {"Name": "Result", "OutputVariableName": "op-B001-Result"},
+                {"Name": "Result", "OutputVariableName": "op-B001-Result"},
+                id="output_creation",
+            ),
+            pytest.param(
+                Edge,
+                {"EdgeID": "E001", "From": "B001", "To": "B002"},
+                {"EdgeID": "E001", "From": "B001", "To": "B002", "EdgeCondition": None},
+                id="edge_creation",
+            ),
+            pytest.param(
+                Edge,
+                {"EdgeID": "E001", "From": "B001", "To": "B002", "EdgeCondition": "true"},
+                {"EdgeCondition": "true"},
+                id="edge_with_condition",
+            ),
+        ],
+    )
+    def test_model_fields(self, model_cls, kwargs, expected):
+        """Test simple workflow models keep the given fields and defaults."""
+        instance = model_cls(**kwargs)
+        for field, value in expected.items():
+            assert getattr(instance, field) == value
 
     def test_block_creation(self):
         """Test Block creation."""
@@ -55,19 +78,6 @@ class TestWorkflowSchemas:
         assert len(block.Inputs) == 1
         assert len(block.Outputs) == 1
 
-    def test_edge_creation(self):
-        """Test Edge creation."""
-        edge = Edge(EdgeID="E001", From="B001", To="B002")
-        assert edge.EdgeID == "E001"
-        assert edge.From == "B001"
-        assert edge.To == "B002"
-        assert edge.EdgeCondition is None
-
-    def test_edge_with_condition(self):
-        """Test Edge with condition."""
-        edge = Edge(EdgeID="E001", From="B001", To="B002", EdgeCondition="true")
-        assert edge.EdgeCondition == "true"
-
     def test_workflow_creation(self):
         """Test Workflow creation."""
         workflow = Workflow(
@@ -180,8 +190,8 @@ class TestToolSchemas:
 
     def test_web_search_input_too_many_queries(self):
         """Test web search input with too many queries."""
-        with pytest.raises(ValidationError):
-            WebSearchInput(queries=["q"] * 11)  # Max is 10
+        with pytest.raises(ValidationError, match="at most 10 items"):
+            WebSearchInput(queries=["q"] * 11)
 
     def test_web_search_input_empty_queries(self):
         """Test web search input with empty queries."""
@@ -200,5 +210,19 @@ class TestToolSchemas:
 
     def test_clarify_input_too_many_questions(self):
         """Test clarify input with too many questions."""
-        with pytest.raises(ValidationError):
-            ClarifyInput(questions=["q"] * 6)  # Max is 5
+        with pytest.raises(ValidationError, match="at most 5 items"):
+            ClarifyInput(questions=["q"] * 6)
+
+
+class TestSampleWorkflows:
+    """Tests for the shared SampleWorkflows fixtures."""
+
+    def test_accessor_returns_independent_copies(self):
+        """Mutating a returned workflow must not leak into later callers."""
+        first = SampleWorkflows.simple_export()
+        first.job_name = "Mutated"
+        first.workflow_json[1].Inputs[0].StaticValue = "Changed"
+
+        second = SampleWorkflows.simple_export()
+        assert second.job_name is None
+        assert second.workflow_json[1].Inputs[0].StaticValue == "HCM"
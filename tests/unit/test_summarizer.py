@@ -1,17 +1,21 @@
 """Tests for MessageSummarizer and token estimation."""
 
-from unittest.mock import AsyncMock
+from pathlib import Path
+from typing import Any
 
 import pytest
 
 from reasoning_engine_pro.agents.summarizer import MessageSummarizer
 from reasoning_engine_pro.core.enums import MessageRole
-from reasoning_engine_pro.core.schemas.messages import ChatMessage
+from reasoning_engine_pro.core.schemas.messages import ChatMessage, ToolCall
 from reasoning_engine_pro.core.utils.token_estimation import (
     estimate_tokens,
     should_summarize,
 )
 
+# ~125K estimated tokens; built once rather than per test run.
+_OVER_LIMIT_CONTENT = "x" * 500_000
+
 
 # ---------------------------------------------------------------------------
 # Token estimation tests
@@ -21,59 +25,74 @@ from reasoning_engine_pro.core.utils.token_estimation import (
 class TestTokenEstimation:
     """Tests for token estimation utilities."""
 
-    def test_estimate_tokens_single_message(self):
-        messages = [ChatMessage(role=MessageRole.USER, content="Hello world")]
-        tokens = estimate_tokens(messages)
-        # "Hello world" = 11 chars, "user" = 4, +10 overhead = 25 / 4 ~ 6
-        assert tokens > 0
-        assert tokens < 100
-
-    def test_estimate_tokens_empty_content(self):
-        messages = [ChatMessage(role=MessageRole.USER, content="")]
-        tokens = estimate_tokens(messages)
-        assert tokens >= 1
-
-    def test_estimate_tokens_multiple_messages(self):
+    @pytest.mark.parametrize(
+        ("turns", "expected"),
+        [
+            # "Hello world" = 11 chars, "user" = 4, +10 overhead = 25 // 4
+            pytest.param([(MessageRole.USER, "Hello world")], 6, id="single"),
+            # Overhead only: 14 // 4
+            pytest.param([(MessageRole.USER, "")], 3, id="empty_content"),
+            pytest.param([(MessageRole.USER, None)], 3, id="none_content"),
+            # (5 + 4 + 10) + (1000 + 9 + 10) = 1038 chars // 4
+            pytest.param(
+                [(MessageRole.USER, "Short"), (MessageRole.ASSISTANT, "A" * 1000)],
+                259,
+                id="multiple",
+            ),
+        ],
+    )
+    def test_estimate_tokens(self, turns, expected):
+        messages = [ChatMessage(role=role, content=content) for role, content in turns]
+        assert estimate_tokens(messages) == expected
+
+    @pytest.mark.parametrize(
+        ("content", "limit", "expected"),
+        [
+            pytest.param("Hello", 100_000, False, id="below_limit"),
+            pytest.param(_OVER_LIMIT_CONTENT, 100_000, True, id="above_limit"),
+            # ~25 tokens > 5
+            pytest.param("x" * 100, 5, True, id="custom_limit"),
+        ],
+    )
+    def test_should_summarize(self, content, limit, expected):
+        messages = [ChatMessage(role=MessageRole.USER, content=content)]
+        assert should_summarize(messages, limit=limit) is expected
+
+    @pytest.mark.parametrize(("total_chars", "expected"), [(39, False), (40, True)])
+    def test_should_summarize_boundary(self, total_chars, expected):
+        # Two "user" messages carry 2 * 14 overhead chars; 40 // 4 is the first
+        # estimate above a limit of 9.
         messages = [
-            ChatMessage(role=MessageRole.USER, content="Short"),
-            ChatMessage(role=MessageRole.ASSISTANT, content="A" * 1000),
+            ChatMessage(role=MessageRole.USER, content=""),
+            ChatMessage(role=MessageRole.USER, content="x" * (total_chars - 28)),
         ]
-        tokens = estimate_tokens(messages)
-        # Second message has ~1000 chars → ~250 tokens + overhead
-        assert tokens > 200
+        assert should_summarize(messages, limit=9) is expected
+        assert (estimate_tokens(messages) > 9) is expected
 
-    def test_estimate_tokens_none_content(self):
-        messages = [ChatMessage(role=MessageRole.USER, content=None)]
-        tokens = estimate_tokens(messages)
-        assert tokens >= 1
 
-    def test_should_summarize_below_limit(self):
-        messages = [ChatMessage(role=MessageRole.USER, content="Hello")]
-        assert should_summarize(messages, limit=100_000) is False
+# ---------------------------------------------------------------------------
+# MessageSummarizer tests
+# ---------------------------------------------------------------------------
 
-    def test_should_summarize_above_limit(self):
-        # Create messages totaling well above 100K tokens
-        big_content = "x" * 500_000  # ~125K tokens
-        messages = [ChatMessage(role=MessageRole.USER, content=big_content)]
-        assert should_summarize(messages, limit=100_000) is True
 
-    def test_should_summarize_custom_limit(self):
-        messages = [ChatMessage(role=MessageRole.USER, content="x" * 100)]
-        # With limit=5, ~25 tokens > 5 → should summarize
-        assert should_summarize(messages, limit=5) is True
+class _RecordingGenerate:
+    """generate() stub that returns a fixed reply and records each call."""
 
+    def __init__(self, content: str = "Summary") -> None:
+        self._reply = ChatMessage(role=MessageRole.ASSISTANT, content=content)
+        self.calls: list[tuple[list[ChatMessage], dict[str, Any]]] = []
 
-# ---------------------------------------------------------------------------
-# MessageSummarizer tests
-# ---------------------------------------------------------------------------
+    async def __call__(self, messages: list[ChatMessage], **kwargs: Any) -> ChatMessage:
+        self.calls.append((messages, kwargs))
+        return self._reply
 
 
 class TestMessageSummarizer:
     """Tests for MessageSummarizer."""
 
     @pytest.fixture
-    def mock_llm(self):
-        return AsyncMock()
+    def mock_llm(self, mock_llm_provider):
+        return mock_llm_provider
 
     @pytest.fixture
     def summarizer(self, mock_llm):
@@ -87,16 +106,13 @@ class TestMessageSummarizer:
             ChatMessage(role=MessageRole.USER, content="Hello"),
         ]
         result = await summarizer.summarize(messages)
-        assert result == messages
+        assert result is messages
 
     @pytest.mark.asyncio
     async def test_summarizes_long_conversation(self, summarizer, mock_llm):
         """Conversation with >2 messages is summarized."""
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="User wants to export HCM config for Benefits.",
-            )
+        mock_llm.generate = _RecordingGenerate(
+            "User wants to export HCM config for Benefits."
         )
 
         messages = [
@@ -128,12 +144,7 @@ class TestMessageSummarizer:
     @pytest.mark.asyncio
     async def test_preserves_system_message(self, summarizer, mock_llm):
         """System message is preserved in output."""
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="Summary text",
-            )
-        )
+        mock_llm.generate = _RecordingGenerate("Summary text")
 
         messages = [
             ChatMessage(role=MessageRole.SYSTEM, content="You are a planner"),
@@ -150,12 +161,7 @@ class TestMessageSummarizer:
     @pytest.mark.asyncio
     async def test_no_system_message(self, summarizer, mock_llm):
         """Works when there is no system message."""
-        mock_llm.generate = AsyncMock(
-            return_value=ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="Summary without system",
-            )
-        )
+        mock_llm.generate = _RecordingGenerate("Summary without system")
 
         messages = [
             ChatMessage(role=MessageRole.USER, content="Hello"),
@@ -171,9 +177,10 @@ class TestMessageSummarizer:
         assert "Summary without system" in result[0].content
 
     @pytest.mark.asyncio
-    async def test_returns_original_on_llm_failure(self, summarizer, mock_llm):
+    async def test_returns_original_on_llm_failure(
+        self, summarizer, failing_llm_provider
+    ):
         """Returns original messages when LLM call fails."""
-        mock_llm.generate = AsyncMock(side_effect=RuntimeError("LLM down"))
 
         messages = [
             ChatMessage(role=MessageRole.USER, content="Hello"),
@@ -182,22 +189,12 @@ class TestMessageSummarizer:
         ]
 
         result = await summarizer.summarize(messages)
-        assert result == messages
+        assert result is messages
 
     @pytest.mark.asyncio
     async def test_calls_llm_with_conversation_text(self, summarizer, mock_llm):
         """LLM is called with formatted conversation text."""
-        captured_messages = None
-
-        async def capture_generate(messages, **kwargs):
-            nonlocal captured_messages
-            captured_messages = messages
-            return ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="Summary",
-            )
-
-        mock_llm.generate = capture_generate
+        mock_llm.generate = generate = _RecordingGenerate()
 
         messages = [
             ChatMessage(role=MessageRole.USER, content="Export config"),
@@ -207,7 +204,8 @@ class TestMessageSummarizer:
 
         await summarizer.summarize(messages)
 
-        assert captured_messages is not None
+        assert len(generate.calls) == 1
+        captured_messages, _ = generate.calls[0]
         # Should have system prompt + user message with conversation text
         assert len(captured_messages) == 2
         assert captured_messages[0].role == MessageRole.SYSTEM
@@ -219,22 +217,115 @@ class TestMessageSummarizer:
     @pytest.mark.asyncio
     async def test_uses_low_temperature(self, summarizer, mock_llm):
         """Summarizer uses low temperature for deterministic output."""
-        captured_kwargs = {}
+        mock_llm.generate = generate = _RecordingGenerate()
 
-        async def capture_generate(messages, **kwargs):
-            captured_kwargs.update(kwargs)
-            return ChatMessage(
-                role=MessageRole.ASSISTANT,
-                content="Summary",
-            )
+        messages = [
+            ChatMessage(role=MessageRole.USER, content="A"),
+            ChatMessage(role=MessageRole.ASSISTANT, content="B"),
+            ChatMessage(role=MessageRole.USER, content="C"),
+        ]
+
+        await summarizer.summarize(messages)
+        _, captured_kwargs = generate.calls[0]
+        assert captured_kwargs.get("temperature") == 0.1
 
-        mock_llm.generate = capture_generate
+    @pytest.mark.asyncio
+    async def test_preserves_recent_messages_within_budget(self, summarizer, mock_llm):
+        """Recent messages that fit keep_recent_tokens are kept verbatim."""
+        mock_llm.generate = _RecordingGenerate()
 
+        messages = [
+            ChatMessage(role=MessageRole.SYSTEM, content="System prompt"),
+            ChatMessage(role=MessageRole.USER, content="x" * 400),
+            ChatMessage(role=MessageRole.ASSISTANT, content="Which module?"),
+            ChatMessage(role=MessageRole.USER, content="Benefits"),
+        ]
+
+        # The last two messages estimate to 8 + 5 tokens; the first user turn
+        # (~103 tokens) does not fit.
+        result = await summarizer.summarize(messages, keep_recent_tokens=20)
+
+        assert [m.content for m in result[2:]] == ["Which module?", "Benefits"]
+        assert result[0] is messages[0]
+        assert "[Conversation Summary]" in result[1].content
+
+    @pytest.mark.asyncio
+    async def test_tail_never_starts_with_tool_result(self, summarizer, mock_llm):
+        """Tool results whose call is summarized away are summarized too."""
+        mock_llm.generate = _RecordingGenerate()
+
+        messages = [
+            ChatMessage(role=MessageRole.USER, content="x" * 400),
+            ChatMessage(role=MessageRole.ASSISTANT, content="x" * 400),
+            ChatMessage(role=MessageRole.TOOL, content="result", tool_call_id="c1"),
+            ChatMessage(role=MessageRole.USER, content="Next"),
+        ]
+
+        result = await summarizer.summarize(messages, keep_recent_tokens=20)
+
+        assert [m.content for m in result[1:]] == ["Next"]
+
+    @pytest.mark.asyncio
+    async def test_returns_as_is_when_all_fit_budget(self, summarizer, mock_llm):
+        """No LLM call is made when every message fits the recent budget."""
+        mock_llm.generate = generate = _RecordingGenerate()
+
+        messages = [
+            ChatMessage(role=MessageRole.SYSTEM, content="System prompt"),
+            ChatMessage(role=MessageRole.USER, content="Hello"),
+            ChatMessage(role=MessageRole.ASSISTANT, content="Hi!"),
+        ]
+
+        result = await summarizer.summarize(messages, keep_recent_tokens=1_000)
+
+        assert result is messages
+        assert generate.calls == []
+
+    @pytest.mark.asyncio
+    async def test_tool_heavy_history_keeps_tool_results(self, summarizer, mock_llm):
+        """Tool results reach the summarizing LLM whole, not as excerpts."""
+        mock_llm.generate = generate = _RecordingGenerate()
+
+        call = ToolCall(
+            id="c1", name="task_block_search", arguments={"queries": ["hcm"]}
+        )
+        blocks = ", ".join(f'{{"block_id": "BLK{i}"}}' for i in range(40))
+        messages = [
+            ChatMessage(role=MessageRole.SYSTEM, content="System prompt"),
+            ChatMessage(role=MessageRole.USER, content="Export HCM for Benefits"),
+            ChatMessage(role=MessageRole.ASSISTANT, content="", tool_calls=[call]),
+            ChatMessage(
+                role=MessageRole.TOOL,
+                content=f"[{blocks}]",
+                tool_call_id="c1",
+                name="task_block_search",
+            ),
+            ChatMessage(role=MessageRole.USER, content="Now build it"),
+        ]
+
+        result = await summarizer.summarize(messages)
+
+        assert len(generate.calls) == 1
+        prompt = generate.calls[0][0][1].content
+        assert f"[{blocks}]" in prompt
+        assert result[1].content == "[Conversation Summary]\nSummary"
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_read_once(self, summarizer, mock_llm, monkeypatch):
+        """The summarizer template is read from disk once, not per call."""
+        mock_llm.generate = generate = _RecordingGenerate()
         messages = [
             ChatMessage(role=MessageRole.USER, content="A"),
             ChatMessage(role=MessageRole.ASSISTANT, content="B"),
             ChatMessage(role=MessageRole.USER, content="C"),
         ]
+        await summarizer.summarize(messages)
+
+        def fail_read(self, *args, **kwargs):
+            raise AssertionError("template re-read from disk")
 
+        monkeypatch.setattr(Path, "read_text", fail_read)
         await summarizer.summarize(messages)
-        assert captured_kwargs.get("temperature") == 0.1
+
+        prompts = [messages[0] for messages, _ in generate.calls]
+        assert prompts[0].content == prompts[1].content
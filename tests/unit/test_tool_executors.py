@@ -1,9 +1,11 @@
 """Tests for tool executors."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from reasoning_engine_pro.core.enums import ToolType
 from reasoning_engine_pro.core.schemas.tools import (
     ClarifyInput,
     ClarifyOutput,
@@ -16,7 +18,9 @@ from reasoning_engine_pro.tools.executors.clarify import ClarifyExecutor
 from reasoning_engine_pro.tools.executors.task_block_search import (
     TaskBlockSearchExecutor,
 )
+from reasoning_engine_pro.tools.executors.think_approach import ThinkApproachExecutor
 from reasoning_engine_pro.tools.executors.web_search import WebSearchExecutor
+from reasoning_engine_pro.tools.registry import ToolRegistry
 
 
 @pytest.fixture
@@ -87,6 +91,11 @@ class TestClarifyExecutor:
         assert func["function"]["name"] == "clarify"
         assert "parameters" in func["function"]
 
+    def test_to_openai_function_cached(self):
+        """Test the OpenAI schema is built once per executor."""
+        executor = ClarifyExecutor()
+        assert executor.to_openai_function() is executor.to_openai_function()
+
 
 class TestWebSearchExecutor:
     """Tests for WebSearchExecutor."""
@@ -112,6 +121,75 @@ class TestWebSearchExecutor:
         assert result.query_count == 2
         assert mock_web_search_service.search.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_runs_queries_concurrently(self):
+        """Test queries are in flight together and results keep query order."""
+        in_flight = 0
+        peak = 0
+
+        async def search(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [WebSearchResult(title=query, url="https://example.com", snippet="")]
+
+        service = MagicMock()
+        service.search = search
+        executor = WebSearchExecutor(service)
+        queries = ["q1", "q2", "q3", "q4", "q5"]
+
+        result = await executor.execute(WebSearchInput(queries=queries))
+
+        assert peak == len(queries)
+        assert [r.title for r in result.results] == queries
+
+    @pytest.mark.asyncio
+    async def test_execute_caps_concurrency(self):
+        """Test no more than max_concurrency searches run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def search(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        service = MagicMock()
+        service.search = search
+        executor = WebSearchExecutor(service, max_concurrency=2)
+
+        await executor.execute(WebSearchInput(queries=["q1", "q2", "q3", "q4", "q5"]))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_failure_cancels_pending_searches(self):
+        """Test one failing query cancels the rest and re-raises unwrapped."""
+        cancelled: list[str] = []
+
+        async def search(query):
+            if query == "bad":
+                raise RuntimeError("search failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+
+        service = MagicMock()
+        service.search = search
+        executor = WebSearchExecutor(service)
+
+        with pytest.raises(RuntimeError, match="search failed"):
+            await executor.execute(WebSearchInput(queries=["q1", "bad", "q3"]))
+
+        assert sorted(cancelled) == ["q1", "q3"]
+
 
 class TestTaskBlockSearchExecutor:
     """Tests for TaskBlockSearchExecutor."""
@@ -132,3 +210,112 @@ class TestTaskBlockSearchExecutor:
         # Should have 1 unique result, not 2
         assert len(result.results) == 1
         assert result.query_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_highest_score(self):
+        """Test duplicates across queries keep the best-scoring result."""
+        scores = {"export": 0.4, "config": 0.8, "other": 0.6}
+
+        async def search(query):
+            return [
+                TaskBlockSearchResult(
+                    block_id="export-config",
+                    name=query,
+                    action_code="ExportConfigurations",
+                    relevance_score=scores[query],
+                )
+            ]
+
+        service = MagicMock()
+        service.search = search
+        executor = TaskBlockSearchExecutor(service)
+
+        result = await executor.execute(
+            TaskBlockSearchInput(queries=["export", "config", "other"])
+        )
+
+        assert len(result.results) == 1
+        assert result.results[0].name == "config"
+        assert result.total_results == 1
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        return ToolRegistry()
+
+    def test_get_all_definitions_cached(self, registry):
+        """Test definitions are built once until the registry changes."""
+        executor = ClarifyExecutor()
+        executor.to_openai_function = MagicMock(
+            wraps=executor.to_openai_function
+        )
+        registry.register(executor)
+
+        first = registry.get_all_definitions()
+        second = registry.get_all_definitions()
+
+        assert first is second
+        assert first[0]["function"]["name"] == "clarify"
+        assert executor.to_openai_function.call_count == 1
+
+    def test_get_all_definitions_invalidated_on_change(
+        self, registry, mock_web_search_service
+    ):
+        """Test register and clear invalidate the cached definitions."""
+        registry.register(ClarifyExecutor())
+        assert len(registry.get_all_definitions()) == 1
+
+        registry.register(WebSearchExecutor(mock_web_search_service))
+        assert len(registry.get_all_definitions()) == 2
+
+        registry.clear()
+        assert registry.get_all_definitions() == ()
+
+    def test_get_by_type(self, registry, mock_web_search_service):
+        """Test lookup by ToolType, ignoring tools without a ToolType member."""
+        web_search = WebSearchExecutor(mock_web_search_service)
+        registry.register(web_search)
+        registry.register(ThinkApproachExecutor())
+
+        assert registry.get_by_type(ToolType.WEB_SEARCH) is web_search
+        assert registry.get_by_type(ToolType.CLARIFY) is None
+        assert registry.get("think_approach") is not None
+
+        registry.clear()
+        assert registry.get_by_type(ToolType.WEB_SEARCH) is None
+
+    def test_get_instance_is_shared(self):
+        """Test get_instance returns one shared registry until reset."""
+        ToolRegistry.reset()
+        try:
+            shared = ToolRegistry.get_instance()
+            assert ToolRegistry.get_instance() is shared
+            assert ToolRegistry() is not shared
+        finally:
+            ToolRegistry.reset()
+
+    def test_register_many(self, registry, mock_web_search_service):
+        """Test batch registration indexes by name and type."""
+        web_search = WebSearchExecutor(mock_web_search_service)
+        registry.register(ClarifyExecutor())
+        assert len(registry.get_all_definitions()) == 1
+
+        registry.register_many([web_search, ThinkApproachExecutor()])
+
+        assert registry.list_tools() == ("clarify", "web_search", "think_approach")
+        assert registry.get_by_type(ToolType.WEB_SEARCH) is web_search
+        assert len(registry.get_all_definitions()) == 3
+
+    def test_list_tools_cached(self, registry):
+        """Test tool names are a cached tuple refreshed on registration."""
+        registry.register(ClarifyExecutor())
+
+        names = registry.list_tools()
+        assert names == ("clarify",)
+        assert registry.list_tools() is names
+
+        registry.register(ThinkApproachExecutor())
+        assert registry.list_tools() == ("clarify", "think_approach")
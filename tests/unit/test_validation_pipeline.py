@@ -1,12 +1,13 @@
 """Tests for validation interface, pipeline, and individual validators."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
 from reasoning_engine_pro.core.enums import MessageRole
 from reasoning_engine_pro.core.schemas.messages import ChatMessage
+from reasoning_engine_pro.core.schemas.tools import TaskBlockSearchResult
 from reasoning_engine_pro.agents.validator import StructuralValidator, WorkflowValidator
 from reasoning_engine_pro.agents.validators.edge_connection_validator import (
     EdgeConnectionValidator,
@@ -28,6 +29,11 @@ from reasoning_engine_pro.core.schemas.workflow import (
 from tests.fixtures.sample_workflows import SampleWorkflows
 
 
+async def _no_task_blocks(query: str) -> list[TaskBlockSearchResult]:
+    """Task block search stub that finds nothing."""
+    return []
+
+
 def _make_context(conversation_id: str = "test-conv") -> ValidationContext:
     return ValidationContext(
         conversation_id=conversation_id,
@@ -55,33 +61,33 @@ class TestStructuralValidator:
     def test_backward_compat_alias(self):
         assert WorkflowValidator is StructuralValidator
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_valid_workflow(self, validator):
         workflow = SampleWorkflows.simple_export()
         result = await validator.validate(workflow, _make_context())
         assert result.is_valid
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_valid_without_context(self, validator):
         """Backward compat — validate with None context still works."""
         workflow = SampleWorkflows.simple_export()
         result = await validator.validate(workflow, None)
         assert result.is_valid
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_missing_start_block(self, validator):
         workflow = SampleWorkflows.invalid_missing_start()
         result = await validator.validate(workflow, _make_context())
         assert not result.is_valid
         assert any("Start" in e for e in result.errors)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_broken_reference(self, validator):
         workflow = SampleWorkflows.invalid_broken_reference()
         result = await validator.validate(workflow, _make_context())
         assert any("op-B999" in e for e in result.errors)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_duplicate_block_id(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -93,7 +99,7 @@ class TestStructuralValidator:
         result = await validator.validate(workflow, _make_context())
         assert any("Duplicate BlockId" in e for e in result.errors)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_edge_reference(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -106,7 +112,7 @@ class TestStructuralValidator:
         result = await validator.validate(workflow, _make_context())
         assert any("B999" in e for e in result.errors)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_strict_mode_promotes_warnings(self):
         validator = StructuralValidator(strict_mode=True)
         workflow = Workflow(
@@ -160,7 +166,7 @@ class TestEdgeConnectionValidator:
         assert validator.name == "edge_connection"
         assert validator.is_blocking is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_adds_start_block_when_missing(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -175,7 +181,7 @@ class TestEdgeConnectionValidator:
         assert len(start) == 1
         assert any("Start block was missing" in w for w in result.warnings)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connects_start_to_entry_blocks(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -191,7 +197,7 @@ class TestEdgeConnectionValidator:
         outgoing = [e for e in corrected.edges if e.From == start_block.BlockId]
         assert len(outgoing) == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_deduplicates_edges(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -207,7 +213,7 @@ class TestEdgeConnectionValidator:
         assert len(result.corrected_workflow.edges) == 1
         assert any("Duplicate" in w for w in result.warnings)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_removes_self_loops(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -223,7 +229,29 @@ class TestEdgeConnectionValidator:
         assert len(result.corrected_workflow.edges) == 1
         assert any("Self-loop" in w for w in result.warnings)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_duplicate_self_loop_warned_once_each(self, validator):
+        workflow = Workflow(
+            workflow_json=[
+                Block(BlockId="B001", Name="Start", ActionCode="Start"),
+                Block(BlockId="B002", Name="Loop", ActionCode="LoopAction"),
+            ],
+            edges=[
+                Edge(EdgeID="E001", From="B001", To="B002"),
+                Edge(EdgeID="E002", From="B002", To="B002"),
+                Edge(EdgeID="E003", From="B002", To="B002"),
+            ],
+        )
+        result = await validator.validate(workflow, _make_context())
+        assert [(e.From, e.To) for e in result.corrected_workflow.edges] == [
+            ("B001", "B002")
+        ]
+        assert result.warnings == [
+            "Self-loop removed: E002",
+            "Duplicate edge removed: B002 -> B002",
+        ]
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_warns_disconnected_blocks(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -238,7 +266,7 @@ class TestEdgeConnectionValidator:
         result = await validator.validate(workflow, _make_context())
         assert any("B003" in w and "no edge" in w for w in result.warnings)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_preserves_valid_workflow(self, validator):
         workflow = SampleWorkflows.simple_export()
         result = await validator.validate(workflow, _make_context())
@@ -248,6 +276,13 @@ class TestEdgeConnectionValidator:
         )
         assert result.warnings == []
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_reuses_existing_edge_models(self, validator):
+        workflow = SampleWorkflows.simple_export()
+        result = await validator.validate(workflow, _make_context())
+        corrected = result.corrected_workflow.edges
+        assert all(a is b for a, b in zip(corrected, workflow.edges, strict=True))
+
 
 # ---- LLMBlockValidator ----
 
@@ -255,9 +290,7 @@ class TestEdgeConnectionValidator:
 class TestLLMBlockValidator:
     @pytest.fixture
     def mock_search(self):
-        service = AsyncMock(spec=["search"])
-        service.search = AsyncMock(return_value=[])
-        return service
+        return SimpleNamespace(search=_no_task_blocks)
 
     @pytest.fixture
     def mock_llm(self, mock_llm_provider):
@@ -275,7 +308,7 @@ class TestLLMBlockValidator:
         assert validator.name == "llm_block"
         assert validator.is_blocking is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_skips_start_block(self, validator):
         workflow = Workflow(
             workflow_json=[
@@ -287,7 +320,7 @@ class TestLLMBlockValidator:
         assert result.is_valid
         assert result.corrected_workflow.workflow_json[0].ActionCode == "Start"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handles_no_changes_response(self, validator, mock_llm):
         """LLM returns NO_CHANGES_NEEDED — block remains unchanged."""
         async def _generate(messages, **kwargs):
@@ -303,22 +336,23 @@ class TestLLMBlockValidator:
         assert result.is_valid
         assert result.corrected_workflow is not None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_corrects_block_from_llm_response(self, validator, mock_llm, mock_search):
         """LLM returns a corrected block JSON — validator applies it."""
-        from reasoning_engine_pro.core.schemas.tools import TaskBlockSearchResult
-
         # Mock search returns a matching task block
-        mock_search.search = AsyncMock(return_value=[
-            TaskBlockSearchResult(
-                block_id="tb-001",
-                name="Export Config",
-                action_code="ExportConfigs",
-                inputs=[{"name": "Module", "data_type": {}}],
-                outputs=[{"name": "ConfigFile"}],
-                relevance_score=0.95,
-            ),
-        ])
+        async def _search(query):
+            return [
+                TaskBlockSearchResult(
+                    block_id="tb-001",
+                    name="Export Config",
+                    action_code="ExportConfigs",
+                    inputs=[{"name": "Module", "data_type": {}}],
+                    outputs=[{"name": "ConfigFile"}],
+                    relevance_score=0.95,
+                ),
+            ]
+
+        mock_search.search = _search
 
         corrected_block = {
             "BlockId": "B002",
@@ -344,7 +378,7 @@ class TestLLMBlockValidator:
         b2 = result.corrected_workflow.workflow_json[1]
         assert b2.ActionCode == "ExportConfigs"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handles_custom_block_response(self, validator, mock_llm):
         """LLM indicates custom block (AskWilfred) — handled correctly."""
         corrected = {
@@ -379,7 +413,7 @@ class TestLLMBlockValidator:
         b2 = result.corrected_workflow.workflow_json[1]
         assert b2.ActionCode == "AskWilfred"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_edge_modifications(self, validator, mock_llm):
         """LLM suggests adding and removing edges."""
         async def _generate(messages, **kwargs):
@@ -412,7 +446,46 @@ class TestLLMBlockValidator:
         # Original edge B001->B002 should be removed
         assert ("B001", "B002") not in edge_pairs
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_repeat_validation_uses_cached_response(self, validator, mock_llm):
+        """Re-validating an unchanged workflow does not call the LLM again."""
+        prompts = []
+
+        async def _generate(messages, **kwargs):
+            prompts.append(messages[0].content)
+            return ChatMessage(role="assistant", content="NO_CHANGES_NEEDED")
+
+        mock_llm.generate = _generate
+
+        workflow = SampleWorkflows.simple_export()
+        await validator.validate(workflow, _make_context())
+        first_round = len(prompts)
+        assert first_round > 0
+
+        await validator.validate(workflow, _make_context())
+        assert len(prompts) == first_round
+
+        validator.clear_cache()
+        await validator.validate(workflow, _make_context())
+        assert len(prompts) == 2 * first_round
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_response_cache_evicts_least_recent(self, mock_llm, mock_search):
+        validator = LLMBlockValidator(
+            llm_provider=mock_llm, search_service=mock_search, cache_size=2
+        )
+
+        async def _generate(messages, **kwargs):
+            return ChatMessage(role="assistant", content=messages[0].content)
+
+        mock_llm.generate = _generate
+
+        for prompt in ("a", "b", "a", "c"):
+            await validator._call_llm(prompt)
+
+        assert set(validator._responses.values()) == {"a", "c"}
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_llm_failure_returns_warnings(self, validator, mock_llm):
         """LLM throws an exception — block is unchanged, warning added."""
         async def _generate(messages, **kwargs):
@@ -422,8 +495,8 @@ class TestLLMBlockValidator:
 
         workflow = SampleWorkflows.simple_export()
         result = await validator.validate(workflow, _make_context())
-        # Non-Start block should have a warning about failure
-        assert len(result.warnings) > 0
+        # Only the non-Start block is sent to the LLM, so exactly one warning
+        assert result.warnings == ["Block validation failed for B002: LLM failed"]
 
 
 # ---- Response Parsing ----
@@ -432,10 +505,9 @@ class TestLLMBlockValidator:
 class TestResponseParsing:
     @pytest.fixture
     def validator(self, mock_llm_provider):
-        search = AsyncMock(spec=["search"])
         return LLMBlockValidator(
             llm_provider=mock_llm_provider,
-            search_service=search,
+            search_service=SimpleNamespace(search=_no_task_blocks),
         )
 
     def test_parse_no_changes(self, validator):
@@ -453,6 +525,12 @@ class TestResponseParsing:
         assert len(result["edges_to_add"]) == 1
         assert result["edges_to_add"][0]["From"] == "B001"
 
+    def test_parse_edges_alongside_no_changes(self, validator):
+        response = 'NO_CHANGES_NEEDED\nRemove: [{"From": "B001", "To": "B002"}]'
+        result = validator._parse_validation_response(response, {"BlockId": "B002"})
+        assert not result["is_modified"]
+        assert result["edges_to_remove"] == [{"From": "B001", "To": "B002"}]
+
     def test_parse_corrected_block(self, validator):
         block = {"BlockId": "B002", "ActionCode": "NewAction", "Name": "New"}
         response = f"Corrected:\n```json\n{json.dumps(block)}\n```"
@@ -471,7 +549,7 @@ class TestResponseParsing:
 
 
 class TestValidationPipeline:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_runs_stages_in_order(self):
         call_order = []
 
@@ -496,7 +574,7 @@ class TestValidationPipeline:
         assert call_order == ["a", "b"]
         assert result.is_valid
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stops_on_blocking_failure(self):
         class FailingStage(IWorkflowValidator):
             name = "failing"
@@ -517,7 +595,7 @@ class TestValidationPipeline:
         assert not result.is_valid
         assert "critical failure" in result.errors
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_non_blocking_errors_dont_stop(self):
         class WarnStage(IWorkflowValidator):
             name = "warn"
@@ -540,7 +618,7 @@ class TestValidationPipeline:
         assert result.is_valid
         assert "something fishy" in result.warnings
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_corrected_workflow_threads_through(self):
         """Stage 1 corrects workflow, stage 2 sees the corrected version."""
         corrected = SampleWorkflows.import_with_validation()
@@ -571,11 +649,14 @@ class TestValidationPipeline:
         # Final result should carry the corrected workflow
         assert result.corrected_workflow is corrected
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_pipeline(self):
         pipeline = ValidationPipeline()
-        result = await pipeline.validate(SampleWorkflows.simple_export(), _make_context())
+        workflow = SampleWorkflows.simple_export()
+        result = await pipeline.validate(workflow, _make_context())
         assert result.is_valid
+        # The orchestrator falls back to corrected_workflow; it must be the input
+        assert result.corrected_workflow is workflow
 
     def test_add_returns_self(self):
         class Dummy(IWorkflowValidator):